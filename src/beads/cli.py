@@ -60,8 +60,7 @@ class BeadsContext:
             return
         if not self.beads_dir or not self.store:
             return
-        dirty = self.store.get_dirty_issues()
-        if dirty:
+        if self.store.count_dirty_issues() > 0:
             from beads.export import flush_to_jsonl
             jsonl_path = get_jsonl_path(self.beads_dir)
             flush_to_jsonl(self.store, jsonl_path, verbose=self.verbose)
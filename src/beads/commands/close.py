@@ -18,7 +18,8 @@ def close(ctx: BeadsContext, issue_ids: tuple[str, ...], reason: str,
     ctx.ensure_initialized()
     assert ctx.store is not None
 
-    closed_ids = []
+    # Resolve everything first so a bad ID exits before anything is closed
+    to_close = []
     for partial_id in issue_ids:
         full_id = ctx.resolve_issue_id(partial_id)
         issue = ctx.store.get_issue(full_id)
@@ -28,12 +29,18 @@ def close(ctx: BeadsContext, issue_ids: tuple[str, ...], reason: str,
         if issue.status == "closed":
             click.echo(f"Already closed: {full_id}", err=True)
             continue
+        to_close.append(issue)
 
-        ctx.store.close_issue(full_id, reason, ctx.actor)
-        closed_ids.append(full_id)
-
-        if not ctx.quiet:
-            click.echo(f"Closed {full_id}: {issue.title}")
+    # One commit for the whole batch
+    closed_ids = []
+    with ctx.store.transaction():
+        for issue in to_close:
+            ctx.store.close_issue(issue.id, reason, ctx.actor)
+            closed_ids.append(issue.id)
+
+    if not ctx.quiet:
+        for issue in to_close:
+            click.echo(f"Closed {issue.id}: {issue.title}")
 
     ctx.auto_flush()
 
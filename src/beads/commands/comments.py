@@ -7,6 +7,7 @@ import sys
 import click
 
 from beads.cli import BeadsContext, pass_ctx
+from beads.models import now_utc
 from beads.utils import format_time_ago
 
 
@@ -19,18 +20,20 @@ def comments(ctx: BeadsContext, issue_id: str) -> None:
     assert ctx.store is not None
 
     full_id = ctx.resolve_issue_id(issue_id)
-    comment_list = ctx.store.get_comments(full_id)
 
     if ctx.json_output:
-        ctx.output([c.to_dict() for c in comment_list])
+        ctx.output([c.to_dict() for c in ctx.store.get_comments(full_id)])
         return
 
-    if not comment_list:
-        click.echo(f"No comments on {full_id}")
-        return
+    # Stream rows straight to the terminal; long threads never sit in memory
+    now = now_utc()
+    shown = 0
+    for c in ctx.store.iter_comments(full_id):
+        click.echo(f"  [{format_time_ago(c.created_at, now)}] {c.author}: {c.text}")
+        shown += 1
 
-    for c in comment_list:
-        click.echo(f"  [{format_time_ago(c.created_at)}] {c.author}: {c.text}")
+    if not shown:
+        click.echo(f"No comments on {full_id}")
 
 
 @click.group("comment")
@@ -47,12 +47,15 @@ def create(ctx: BeadsContext, title: str, issue_type: str, priority: int,
     now = now_utc()
     prefix = ctx.store.get_config("issue_prefix") or "bd"
 
+    # Resolve every referenced ID before anything is written, so a mistyped
+    # one exits before the write transaction opens
+    parent_id = ctx.resolve_issue_id(parent) if parent else None
+    resolved_deps = [(dep_id, ctx.resolve_issue_id(dep_id)) for dep_id in deps]
+
     # Generate ID
     if custom_id:
         issue_id = custom_id
-    elif parent:
-        # Resolve parent ID
-        parent_id = ctx.resolve_issue_id(parent)
+    elif parent_id:
         # Check depth
         err = check_hierarchy_depth(parent_id)
         if err:
@@ -102,37 +105,37 @@ def create(ctx: BeadsContext, title: str, issue_type: str, priority: int,
             click.echo(f"  Type: {issue_type}, Priority: P{priority}")
         return
 
-    ctx.store.create_issue(issue, ctx.actor)
-
-    # Add parent-child dependency
-    if parent:
-        parent_id = ctx.resolve_issue_id(parent)
-        dep = Dependency(
-            issue_id=issue_id,
-            depends_on_id=parent_id,
-            type=DepType.PARENT_CHILD,
-            created_at=now,
-            created_by=ctx.actor,
-        )
-        try:
-            ctx.store.add_dependency(dep, ctx.actor)
-        except ValueError as e:
-            click.echo(f"Warning: could not add parent dependency: {e}", err=True)
-
-    # Add blocking dependencies
-    for dep_id in deps:
-        resolved = ctx.resolve_issue_id(dep_id)
-        dep = Dependency(
-            issue_id=issue_id,
-            depends_on_id=resolved,
-            type=DepType.BLOCKS,
-            created_at=now,
-            created_by=ctx.actor,
-        )
-        try:
-            ctx.store.add_dependency(dep, ctx.actor)
-        except ValueError as e:
-            click.echo(f"Warning: could not add dependency on {dep_id}: {e}", err=True)
+    # The issue and its dependencies commit together, never half-linked
+    with ctx.store.transaction():
+        ctx.store.create_issue(issue, ctx.actor)
+
+        # Add parent-child dependency
+        if parent_id:
+            dep = Dependency(
+                issue_id=issue_id,
+                depends_on_id=parent_id,
+                type=DepType.PARENT_CHILD,
+                created_at=now,
+                created_by=ctx.actor,
+            )
+            try:
+                ctx.store.add_dependency(dep, ctx.actor)
+            except ValueError as e:
+                click.echo(f"Warning: could not add parent dependency: {e}", err=True)
+
+        # Add blocking dependencies
+        for dep_id, resolved in resolved_deps:
+            dep = Dependency(
+                issue_id=issue_id,
+                depends_on_id=resolved,
+                type=DepType.BLOCKS,
+                created_at=now,
+                created_by=ctx.actor,
+            )
+            try:
+                ctx.store.add_dependency(dep, ctx.actor)
+            except ValueError as e:
+                click.echo(f"Warning: could not add dependency on {dep_id}: {e}", err=True)
 
     # Auto-flush
     ctx.auto_flush()
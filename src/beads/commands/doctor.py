@@ -57,9 +57,9 @@ def doctor(ctx: BeadsContext) -> None:
     click.echo(f"  Issue prefix: {prefix or '(not set)'}")
 
     # Check dirty issues
-    dirty = ctx.store.get_dirty_issues()
+    dirty = ctx.store.count_dirty_issues()
     if dirty:
-        click.echo(f"  Dirty issues: {len(dirty)} (need JSONL export)")
+        click.echo(f"  Dirty issues: {dirty} (need JSONL export)")
     else:
         click.echo("  Dirty issues: 0 (in sync)")
 
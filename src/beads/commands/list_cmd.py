@@ -7,8 +7,8 @@ import json
 import click
 
 from beads.cli import BeadsContext, pass_ctx
-from beads.models import IssueFilter, Status
-from beads.utils import format_issue_row
+from beads.models import IssueFilter, Status, now_utc
+from beads.utils import ISSUE_ROW_FIELDS, issue_row_formatter, issue_row_values
 
 
 @click.command("list")
@@ -34,6 +34,7 @@ def list_cmd(ctx: BeadsContext, status: str | None, priority: int | None,
     """List issues with filters."""
     ctx.ensure_initialized()
     assert ctx.store is not None
+    now = now_utc()  # one clock reading for every row's age
 
     if ready:
         # Delegate to ready work query
@@ -49,6 +50,8 @@ def list_cmd(ctx: BeadsContext, status: str | None, priority: int | None,
         if limit:
             work_filter["limit"] = limit
         issues = ctx.store.get_ready_work(work_filter if work_filter else None)
+        fmt = issue_row_formatter(long_format)
+        lines = [fmt(*issue_row_values(issue), now=now) for issue in issues]
     else:
         f = IssueFilter()
         if status:
@@ -66,18 +69,26 @@ def list_cmd(ctx: BeadsContext, status: str | None, priority: int | None,
         if limit:
             f.limit = limit
 
-        issues = ctx.store.list_issues(f, sort_by=sort_by, reverse=reverse)
+        if ctx.json_output:
+            issues = ctx.store.list_issues(f, sort_by=sort_by, reverse=reverse)
+        else:
+            # Rows only need a handful of columns: skip building Issues
+            rows = ctx.store.list_issues_projected(
+                ISSUE_ROW_FIELDS, f, sort_by=sort_by, reverse=reverse
+            )
+            fmt = issue_row_formatter(long_format)
+            lines = [fmt(*row, now=now) for row in rows]
 
     if ctx.json_output:
         ctx.output([i.to_dict() for i in issues])
         return
 
-    if not issues:
+    if not lines:
         click.echo("No issues found.")
         return
 
-    for issue in issues:
-        click.echo(format_issue_row(issue, long_format=long_format))
+    for line in lines:
+        click.echo(line)
 
     if not ctx.quiet:
-        click.echo(f"\n{len(issues)} issue(s)")
+        click.echo(f"\n{len(lines)} issue(s)")
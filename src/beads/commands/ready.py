@@ -5,7 +5,8 @@ from __future__ import annotations
 import click
 
 from beads.cli import BeadsContext, pass_ctx
-from beads.utils import format_issue_row
+from beads.models import now_utc
+from beads.utils import issue_row_formatter, issue_row_values
 
 
 @click.command("ready")
@@ -48,8 +49,10 @@ def ready(ctx: BeadsContext, issue_type: str | None, priority: int | None,
         click.echo("No ready issues.")
         return
 
+    now = now_utc()  # one clock reading for every row's age
+    fmt = issue_row_formatter(long_format)
     for issue in issues:
-        click.echo(format_issue_row(issue, long_format=long_format))
+        click.echo(fmt(*issue_row_values(issue), now=now))
 
     if not ctx.quiet:
         click.echo(f"\n{len(issues)} ready issue(s)")
@@ -5,8 +5,8 @@ from __future__ import annotations
 import click
 
 from beads.cli import BeadsContext, pass_ctx
-from beads.models import IssueFilter, Status
-from beads.utils import format_issue_row
+from beads.models import IssueFilter, Status, now_utc
+from beads.utils import ISSUE_ROW_FIELDS, issue_row_formatter
 
 
 @click.command("search")
@@ -32,17 +32,19 @@ def search(ctx: BeadsContext, query: str, status: str | None,
     if issue_type:
         f.issue_type = issue_type
 
-    issues = ctx.store.search_issues(query, f)
-
     if ctx.json_output:
+        issues = ctx.store.search_issues(query, f)
         ctx.output([i.to_dict() for i in issues])
         return
 
-    if not issues:
+    rows = ctx.store.search_issues_projected(ISSUE_ROW_FIELDS, query, f)
+    if not rows:
         click.echo(f"No issues matching '{query}'")
         return
 
-    for issue in issues:
-        click.echo(format_issue_row(issue, long_format=long_format))
+    now = now_utc()  # one clock reading for every row's age
+    fmt = issue_row_formatter(long_format)
+    for row in rows:
+        click.echo(fmt(*row, now=now))
 
-    click.echo(f"\n{len(issues)} result(s)")
+    click.echo(f"\n{len(rows)} result(s)")
@@ -95,13 +95,14 @@ def update(ctx: BeadsContext, issue_id: str, status: str | None,
         click.echo("No updates specified.", err=True)
         sys.exit(1)
 
-    if updates:
-        ctx.store.update_issue(full_id, updates, ctx.actor)
-
-    for lbl in add_label:
-        ctx.store.add_label(full_id, lbl, ctx.actor)
-    for lbl in remove_label:
-        ctx.store.remove_label(full_id, lbl, ctx.actor)
+    with ctx.store.transaction():
+        if updates:
+            ctx.store.update_issue(full_id, updates, ctx.actor)
+
+        for lbl in add_label:
+            ctx.store.add_label(full_id, lbl, ctx.actor)
+        for lbl in remove_label:
+            ctx.store.remove_label(full_id, lbl, ctx.actor)
 
     ctx.auto_flush()
 
@@ -10,12 +10,12 @@ Matches Go's export behavior:
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 from typing import TYPE_CHECKING
 
-from beads.models import Issue, IssueFilter, format_timestamp
+from beads.jsonutil import dumps
+from beads.models import IssueFilter, format_timestamp
 
 if TYPE_CHECKING:
     from beads.storage.interface import Storage
@@ -27,40 +27,38 @@ def flush_to_jsonl(store: Storage, jsonl_path: str, verbose: bool = False) -> in
     This does a full rewrite (not incremental) to ensure consistency.
     Returns the number of issues written.
     """
-    # Get all non-tombstone issues plus tombstones that haven't expired
-    all_issues = store.search_issues("", IssueFilter(include_tombstones=True))
-
-    # Enrich each issue with labels, dependencies, comments
-    enriched: list[Issue] = []
-    for issue in all_issues:
-        # Skip ephemeral issues
-        if issue.ephemeral:
-            continue
-        full = store.get_issue(issue.id)
-        if full:
-            enriched.append(full)
-
-    # Write JSONL
-    tmp_path = jsonl_path + ".tmp"
-    count = 0
-    try:
-        with open(tmp_path, "w", encoding="utf-8") as f:
-            for issue in enriched:
-                line = json.dumps(issue.to_dict(), ensure_ascii=False, separators=(",", ":"))
-                f.write(line + "\n")
-                count += 1
-        # Atomic rename
-        os.replace(tmp_path, jsonl_path)
-    except Exception:
-        # Clean up temp file on error
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-        raise
-
-    # Clear all dirty markers since we did a full export
-    dirty_ids = store.get_dirty_issues()
-    if dirty_ids:
-        store.clear_dirty(dirty_ids)
+    # One write transaction around the whole export: no other writer can
+    # dirty an issue between reading it and clearing its dirty marker, and
+    # the clear commits once.
+    with store.transaction():
+        # Stream all non-tombstone issues plus tombstones that haven't expired.
+        # Labels, dependencies and comments arrive batch-loaded with each
+        # issue, so there is no per-issue follow-up query.
+        all_issues = store.iter_issues(IssueFilter(include_tombstones=True))
+
+        # Write JSONL
+        tmp_path = jsonl_path + ".tmp"
+        count = 0
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for issue in all_issues:
+                    # Skip ephemeral issues
+                    if issue.ephemeral:
+                        continue
+                    f.write(dumps(issue.to_dict()) + "\n")
+                    count += 1
+            # Atomic rename
+            os.replace(tmp_path, jsonl_path)
+        except Exception:
+            # Clean up temp file on error
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        # Clear all dirty markers since we did a full export
+        dirty_ids = store.get_dirty_issues()
+        if dirty_ids:
+            store.clear_dirty(dirty_ids)
 
     if verbose:
         print(f"Exported {count} issues to {jsonl_path}", file=sys.stderr)
@@ -75,8 +73,7 @@ def flush_dirty_to_jsonl(store: Storage, jsonl_path: str, verbose: bool = False)
     when there are dirty issues. This matches the behavior of the Go version's
     flush-only mode.
     """
-    dirty_ids = store.get_dirty_issues()
-    if not dirty_ids:
+    if store.count_dirty_issues() == 0:
         if verbose:
             print("No dirty issues to export", file=sys.stderr)
         return 0
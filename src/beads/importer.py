@@ -16,6 +16,7 @@ import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from beads.jsonutil import loads
 from beads.models import (
     Comment, Dependency, Issue, IssueFilter, Status, format_timestamp, now_utc,
 )
@@ -50,7 +51,7 @@ def parse_jsonl(jsonl_path: str) -> tuple[list[Issue], list[str]]:
             if not line:
                 continue
             try:
-                data = json.loads(line)
+                data = loads(line)
             except json.JSONDecodeError as e:
                 print(f"Warning: skipping malformed line {line_num}: {e}", file=sys.stderr)
                 continue
@@ -77,6 +78,24 @@ def import_jsonl(store: Storage, jsonl_path: str, verbose: bool = False) -> Impo
 
     issues, deletion_ids = parse_jsonl(jsonl_path)
 
+    # One transaction for the whole batch instead of a commit per issue
+    with store.transaction():
+        _apply_import(store, issues, deletion_ids, result)
+
+    if verbose:
+        print(
+            f"Import: {result.created} created, {result.updated} updated, "
+            f"{result.unchanged} unchanged, {result.skipped} skipped, "
+            f"{result.deleted} deleted",
+            file=sys.stderr,
+        )
+
+    return result
+
+
+def _apply_import(store: Storage, issues: list[Issue], deletion_ids: list[str],
+                  result: ImportResult) -> None:
+    """Apply parsed deletions and issues to storage, tallying into result."""
     # Process deletions first
     for del_id in deletion_ids:
         existing = store.get_issue(del_id)
@@ -106,6 +125,7 @@ def import_jsonl(store: Storage, jsonl_path: str, verbose: bool = False) -> Impo
 
     seen_hashes: set[str] = set()
     seen_ids: set[str] = set()
+    new_issues: list[Issue] = []
 
     for incoming in issues:
         h = incoming.content_hash
@@ -170,19 +190,11 @@ def import_jsonl(store: Storage, jsonl_path: str, verbose: bool = False) -> Impo
             result.updated += 1
             continue
 
-        # Phase 3: New issue
-        store.create_issue(incoming, "import")
+        # Phase 3: New issue, inserted with the rest of the batch below
+        new_issues.append(incoming)
         result.created += 1
 
-    if verbose:
-        print(
-            f"Import: {result.created} created, {result.updated} updated, "
-            f"{result.unchanged} unchanged, {result.skipped} skipped, "
-            f"{result.deleted} deleted",
-            file=sys.stderr,
-        )
-
-    return result
+    store.create_issues_bulk(new_issues, "import")
 
 
 def auto_import_if_needed(store: Storage, jsonl_path: str,
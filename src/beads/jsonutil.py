@@ -0,0 +1,42 @@
+"""Compact JSON encoding shared by storage, export and import.
+
+orjson is used when installed (the ``fast`` extra); the stdlib codec is the
+fallback. For strings, ints, bools, None, lists and dicts both emit the same
+compact UTF-8 text (Go's encoding/json form), so stored columns and JSONL
+lines do not depend on which one ran. Floats may differ in exponent form
+(orjson writes ``1e16`` where the stdlib writes ``1e+16``). Types the
+stdlib rejects, such as datetimes and dataclasses, raise TypeError on both
+paths rather than orjson serializing them natively.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(obj: Any) -> str:
+        """Encode obj as compact JSON text."""
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            # orjson rejects what the stdlib accepts, e.g. ints past 64 bits;
+            # passed-through types raise again here, as they would without orjson
+            return _stdlib_dumps(obj)
+
+    loads = orjson.loads
+else:
+    dumps = _stdlib_dumps
+    loads = json.loads
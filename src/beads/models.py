@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Sequence
 
 
 # --- Status constants ---
@@ -40,6 +41,8 @@ class IssueType:
 
     _CORE = {BUG, FEATURE, TASK, EPIC, CHORE}
     _BUILTIN = {BUG, FEATURE, TASK, EPIC, CHORE, EVENT}
+    # Alternate spellings normalize() maps to a core type, keyed lowercase
+    _ALIASES = {"enhancement": FEATURE, "feat": FEATURE}
 
     @classmethod
     def is_valid(cls, t: str) -> bool:
@@ -51,10 +54,7 @@ class IssueType:
 
     @classmethod
     def normalize(cls, t: str) -> str:
-        lower = t.lower()
-        if lower in ("enhancement", "feat"):
-            return cls.FEATURE
-        return t
+        return cls._ALIASES.get(t.lower(), t)
 
 
 # --- DependencyType constants ---
@@ -80,11 +80,11 @@ class DepType:
     VALIDATES = "validates"
     DELEGATED_FROM = "delegated-from"
 
-    _BLOCKING = {BLOCKS, PARENT_CHILD, CONDITIONAL_BLOCKS, WAITS_FOR}
+    _BLOCKING = frozenset({BLOCKS, PARENT_CHILD, CONDITIONAL_BLOCKS, WAITS_FOR})
 
-    @classmethod
-    def affects_ready_work(cls, dep_type: str) -> bool:
-        return dep_type in cls._BLOCKING
+    # The set's own C-level membership test; builtin methods do not bind, so
+    # DepType.affects_ready_work(dep_type) calls it directly
+    affects_ready_work = _BLOCKING.__contains__
 
 
 # --- EventType constants ---
@@ -113,18 +113,14 @@ def parse_timestamp(s: str | None) -> datetime | None:
     s = s.strip()
     if not s:
         return None
+    # Rewrite the Z suffix up front: fromisoformat only accepts it from
+    # Python 3.11, and a failed first attempt costs a raised exception
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
     try:
-        # Python 3.11+ fromisoformat handles timezone
         return datetime.fromisoformat(s)
     except ValueError:
         pass
-    # Handle Z suffix
-    if s.endswith("Z"):
-        s = s[:-1] + "+00:00"
-        try:
-            return datetime.fromisoformat(s)
-        except ValueError:
-            pass
     # Fallback: try common formats
     for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%d %H:%M:%S"):
         try:
@@ -154,6 +150,12 @@ def now_utc() -> datetime:
 
 # --- Dataclasses ---
 
+@lru_cache(maxsize=1024)
+def _hash_content_tokens(tokens: tuple[str, ...]) -> str:
+    """SHA256 of NUL-terminated tokens; see Issue.compute_content_hash."""
+    return hashlib.sha256(("\x00".join(tokens) + "\x00").encode("utf-8")).hexdigest()
+
+
 @dataclass
 class Dependency:
     issue_id: str
@@ -342,124 +344,119 @@ class Issue:
     target: str = ""
     payload: str = ""
 
-    def compute_content_hash(self) -> str:
-        """Compute deterministic content hash matching Go's ComputeContentHash.
+    # Scalar fields in the positional order accepted by _from_row. The
+    # relational lists (labels, dependencies, comments) are not included.
+    _ROW_FIELDS = (
+        "id", "content_hash", "title", "description", "design",
+        "acceptance_criteria", "notes", "spec_id", "status", "priority",
+        "issue_type", "assignee", "owner", "estimated_minutes", "created_at",
+        "created_by", "updated_at", "closed_at", "close_reason",
+        "closed_by_session", "due_at", "defer_until", "external_ref",
+        "source_system", "metadata", "compaction_level", "compacted_at",
+        "compacted_at_commit", "original_size", "deleted_at", "deleted_by",
+        "delete_reason", "original_type", "sender", "ephemeral", "wisp_type",
+        "pinned", "is_template", "bonded_from", "creator", "validations",
+        "quality_score", "crystallizes", "await_type", "await_id", "timeout",
+        "waiters", "holder", "hook_bead", "role_bead", "agent_state",
+        "role_type", "rig", "last_activity", "mol_type", "work_type",
+        "event_kind", "actor", "target", "payload",
+    )
 
-        Uses SHA256 with null-separated fields in the exact same order as Go.
-        """
-        h = hashlib.sha256()
+    @classmethod
+    def _from_row(cls, values: Sequence[Any]) -> Issue:
+        """Build an Issue from already-converted values in _ROW_FIELDS order.
 
-        def write_str(s: str) -> None:
-            h.update(s.encode("utf-8"))
-            h.update(b"\x00")
+        Timestamp fields may be passed as their stored strings; they are
+        parsed lazily on first access.
 
-        def write_int(n: int) -> None:
-            h.update(str(n).encode("utf-8"))
-            h.update(b"\x00")
+        Bypasses __init__ (and its default factories) entirely; the storage
+        layer uses this to hydrate query results without per-field setattr.
+        """
+        issue = cls.__new__(cls)
+        d = issue.__dict__
+        d.update(zip(cls._ROW_FIELDS, values))
+        d["labels"] = []
+        d["dependencies"] = []
+        d["comments"] = []
+        return issue
 
-        def write_str_optional(s: str | None) -> None:
-            if s is not None:
-                h.update(s.encode("utf-8"))
-            h.update(b"\x00")
+    def compute_content_hash(self) -> str:
+        """Compute deterministic content hash matching Go's ComputeContentHash.
 
-        def write_flag(b: bool, label: str) -> None:
-            if b:
-                h.update(label.encode("utf-8"))
-            h.update(b"\x00")
+        Uses SHA256 with null-separated fields in the exact same order as Go.
+        Digests are memoized on the field tokens, so re-hashing unchanged
+        content (an import of an already-synced export) skips the SHA.
+        """
+        return _hash_content_tokens(self._content_hash_tokens())
 
-        def write_float_optional(f: float | None) -> None:
-            if f is not None:
-                # Match Go's %f formatting (6 decimal places)
-                h.update(f"{f:f}".encode("utf-8"))
-            h.update(b"\x00")
+    def _content_hash_tokens(self) -> tuple[str, ...]:
+        """The hashed fields as strings, in Go's order; each is written NUL-terminated."""
+        tokens: list[str] = []
+        add = tokens.append
 
-        def write_duration(d: int) -> None:
-            h.update(str(d).encode("utf-8"))
-            h.update(b"\x00")
+        def add_float_optional(f: float | None) -> None:
+            # Match Go's %f formatting (6 decimal places)
+            add("" if f is None else f"{f:f}")
 
-        def write_entity_ref(e: dict | None) -> None:
+        def add_entity_ref(e: dict | None) -> None:
             if e is not None:
-                write_str(e.get("name", ""))
-                write_str(e.get("platform", ""))
-                write_str(e.get("org", ""))
-                write_str(e.get("id", ""))
+                tokens.extend((e.get("name", ""), e.get("platform", ""),
+                               e.get("org", ""), e.get("id", "")))
 
         # Core fields in stable order (must match Go exactly)
-        write_str(self.title)
-        write_str(self.description)
-        write_str(self.design)
-        write_str(self.acceptance_criteria)
-        write_str(self.notes)
-        write_str(self.spec_id)
-        write_str(self.status)
-        write_int(self.priority)
-        write_str(self.issue_type)
-        write_str(self.assignee)
-        write_str(self.owner)
-        write_str(self.created_by)
+        tokens.extend((
+            self.title, self.description, self.design, self.acceptance_criteria,
+            self.notes, self.spec_id, self.status, str(self.priority),
+            self.issue_type, self.assignee, self.owner, self.created_by,
+        ))
 
         # Optional fields
-        write_str_optional(self.external_ref)
-        write_str(self.source_system)
-        write_flag(self.pinned, "pinned")
-        write_str(self.metadata)  # Include metadata in content hash
-        write_flag(self.is_template, "template")
+        add(self.external_ref or "")
+        add(self.source_system)
+        add("pinned" if self.pinned else "")
+        add(self.metadata)  # Include metadata in content hash
+        add("template" if self.is_template else "")
 
         # Bonded molecules
         for br in self.bonded_from:
-            write_str(br.get("source_id", ""))
-            write_str(br.get("bond_type", ""))
-            write_str(br.get("bond_point", ""))
+            tokens.extend((br.get("source_id", ""), br.get("bond_type", ""),
+                           br.get("bond_point", "")))
 
         # HOP entity tracking
-        write_entity_ref(self.creator)
+        add_entity_ref(self.creator)
 
         # HOP validations
         for v in self.validations:
-            write_entity_ref(v.get("validator"))
-            write_str(v.get("outcome", ""))
+            add_entity_ref(v.get("validator"))
+            add(v.get("outcome", ""))
             ts = v.get("timestamp", "")
             if isinstance(ts, datetime):
                 ts = ts.isoformat()
                 if ts.endswith("+00:00"):
                     ts = ts[:-6] + "Z"
-            write_str(ts)
-            write_float_optional(v.get("score"))
+            add(ts)
+            add_float_optional(v.get("score"))
 
         # HOP aggregate quality score and crystallizes
-        write_float_optional(self.quality_score)
-        write_flag(self.crystallizes, "crystallizes")
+        add_float_optional(self.quality_score)
+        add("crystallizes" if self.crystallizes else "")
 
         # Gate fields
-        write_str(self.await_type)
-        write_str(self.await_id)
-        write_duration(self.timeout)
-        for waiter in self.waiters:
-            write_str(waiter)
+        add(self.await_type)
+        add(self.await_id)
+        add(str(self.timeout))
+        tokens.extend(self.waiters)
 
         # Slot fields
-        write_str(self.holder)
-
-        # Agent identity fields
-        write_str(self.hook_bead)
-        write_str(self.role_bead)
-        write_str(self.agent_state)
-        write_str(self.role_type)
-        write_str(self.rig)
+        add(self.holder)
 
-        # Molecule type
-        write_str(self.mol_type)
-
-        # Work type
-        write_str(self.work_type)
-
-        # Event fields
-        write_str(self.event_kind)
-        write_str(self.actor)
-        write_str(self.target)
-        write_str(self.payload)
-
-        return h.hexdigest()
+        # Agent identity, molecule type, work type and event fields
+        tokens.extend((
+            self.hook_bead, self.role_bead, self.agent_state, self.role_type,
+            self.rig, self.mol_type, self.work_type,
+            self.event_kind, self.actor, self.target, self.payload,
+        ))
+        return tuple(tokens)
 
     def is_tombstone(self) -> bool:
         return self.status == Status.TOMBSTONE
@@ -664,7 +661,11 @@ class Issue:
     @classmethod
     def from_dict(cls, d: dict) -> Issue:
         """Deserialize from dict (JSONL line)."""
-        issue = cls()
+        # Skip __init__: every field it would default is either assigned
+        # below or a constant in _PLAIN_DEFAULTS, so no clock read or list
+        # allocation is wasted on values about to be replaced
+        issue = cls.__new__(cls)
+        issue.__dict__.update(cls._PLAIN_DEFAULTS)
         issue.id = d.get("id", "")
         issue.title = d.get("title", "")
         issue.description = d.get("description", "")
@@ -755,6 +756,48 @@ class Issue:
         return issue
 
 
+class _LazyTimestamp:
+    """Data descriptor for a datetime field that may hold raw text.
+
+    Storage hydration leaves the stored RFC3339 string in the instance dict;
+    it is parsed on first read and the datetime cached back in its place, so
+    listings only pay for the timestamps a caller actually touches.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        d = obj.__dict__
+        value = d.get(self.name)
+        if type(value) is str:
+            value = d[self.name] = parse_timestamp(value)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+# Fields with a constant default; from_dict assigns every factory-built one.
+Issue._PLAIN_DEFAULTS = {f.name: f.default for f in fields(Issue) if f.default is not MISSING}
+# Installed after @dataclass has captured the field defaults.
+Issue._TIMESTAMP_FIELDS = (
+    "created_at", "updated_at", "closed_at", "due_at", "defer_until",
+    "compacted_at", "deleted_at", "last_activity",
+)
+for _name in Issue._TIMESTAMP_FIELDS:
+    setattr(Issue, _name, _LazyTimestamp(_name))
+del _name
+# Child rows are hydrated the same way, for the same reason.
+Dependency.created_at = _LazyTimestamp("created_at")  # type: ignore[assignment]
+Comment.created_at = _LazyTimestamp("created_at")  # type: ignore[assignment]
+Event.created_at = _LazyTimestamp("created_at")  # type: ignore[assignment]
+
+
 @dataclass
 class IssueFilter:
     """Filter for issue queries."""
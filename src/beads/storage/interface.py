@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any
+from typing import Any, ContextManager, Iterable, Iterator
 
 from beads.models import Comment, Dependency, Event, Issue, IssueFilter, Statistics
 
@@ -26,6 +26,10 @@ class Storage(ABC):
     def create_issue(self, issue: Issue, actor: str) -> None:
         """Create a new issue. Marks it dirty for JSONL export."""
 
+    @abstractmethod
+    def create_issues_bulk(self, issues: list[Issue], actor: str) -> None:
+        """Create many issues in one transaction. Marks them dirty for JSONL export."""
+
     @abstractmethod
     def get_issue(self, issue_id: str) -> Issue | None:
         """Get an issue by ID. Returns None if not found."""
@@ -52,11 +56,27 @@ class Storage(ABC):
     def search_issues(self, query: str, filter: IssueFilter) -> list[Issue]:
         """Search issues with text query and filters."""
 
+    @abstractmethod
+    def search_issues_projected(self, fields: tuple[str, ...], query: str,
+                                filter: IssueFilter) -> list[tuple]:
+        """Like search_issues, but return only the named fields as raw row tuples."""
+
     @abstractmethod
     def list_issues(self, filter: IssueFilter, sort_by: str = "created_at",
                     reverse: bool = False) -> list[Issue]:
         """List issues with filters and sorting."""
 
+    @abstractmethod
+    def iter_issues(self, filter: IssueFilter, sort_by: str = "created_at",
+                    reverse: bool = False) -> Iterator[Issue]:
+        """Like list_issues, but stream results instead of building a list."""
+
+    @abstractmethod
+    def list_issues_projected(self, fields: tuple[str, ...], filter: IssueFilter,
+                              sort_by: str = "created_at",
+                              reverse: bool = False) -> list[tuple]:
+        """Like list_issues, but return only the named fields as raw row tuples."""
+
     @abstractmethod
     def get_ready_work(self, filter: dict[str, Any] | None = None) -> list[Issue]:
         """Get issues that are ready to work on (open, not blocked, not deferred)."""
@@ -105,6 +125,10 @@ class Storage(ABC):
     def get_labels(self, issue_id: str) -> list[str]:
         """Get all labels for an issue."""
 
+    @abstractmethod
+    def get_labels_bulk(self, issue_ids: Iterable[str]) -> dict[str, list[str]]:
+        """Get labels for many issues at once, keyed by issue ID."""
+
     # --- Comments ---
 
     @abstractmethod
@@ -115,6 +139,14 @@ class Storage(ABC):
     def get_comments(self, issue_id: str) -> list[Comment]:
         """Get all comments for an issue."""
 
+    @abstractmethod
+    def iter_comments(self, issue_id: str) -> Iterator[Comment]:
+        """Stream comments for an issue, oldest first."""
+
+    @abstractmethod
+    def get_comments_bulk(self, issue_ids: Iterable[str]) -> dict[str, list[Comment]]:
+        """Get comments for many issues at once, keyed by issue ID."""
+
     @abstractmethod
     def import_comment(self, issue_id: str, author: str, text: str,
                        created_at: datetime) -> int:
@@ -126,6 +158,14 @@ class Storage(ABC):
     def get_events(self, issue_id: str) -> list[Event]:
         """Get audit trail events for an issue."""
 
+    @abstractmethod
+    def iter_events(self, issue_id: str) -> Iterator[Event]:
+        """Stream audit trail events for an issue."""
+
+    @abstractmethod
+    def get_events_bulk(self, issue_ids: Iterable[str]) -> dict[str, list[Event]]:
+        """Get audit trail events for many issues at once, keyed by issue ID."""
+
     # --- Dirty tracking ---
 
     @abstractmethod
@@ -136,6 +176,18 @@ class Storage(ABC):
     def get_dirty_issues(self) -> list[str]:
         """Get IDs of all dirty issues."""
 
+    @abstractmethod
+    def iter_dirty_issues(self) -> Iterator[str]:
+        """Stream IDs of all dirty issues."""
+
+    @abstractmethod
+    def is_dirty(self, issue_id: str) -> bool:
+        """Whether an issue has changes not yet exported to JSONL."""
+
+    @abstractmethod
+    def count_dirty_issues(self) -> int:
+        """Count dirty issues without listing them."""
+
     @abstractmethod
     def clear_dirty(self, issue_ids: list[str]) -> None:
         """Clear dirty flags for specific issues."""
@@ -193,8 +245,22 @@ class Storage(ABC):
     # --- Transactions ---
 
     @abstractmethod
+    def transaction(self, immediate: bool = True) -> ContextManager[None]:
+        """Context manager grouping writes into one transaction.
+
+        Commits on normal exit and rolls back on error. Nested calls act as
+        savepoints. Wrapping a batch of create/update calls in one block
+        replaces a commit (and WAL sync) per call with a single commit.
+        """
+
+    @abstractmethod
+    def savepoint(self, name: str) -> ContextManager[None]:
+        """Context manager for a named savepoint inside a transaction."""
+
     def run_in_transaction(self, fn: Any) -> None:
         """Run a function within a database transaction."""
+        with self.transaction():
+            fn(self)
 
     # --- Partial ID resolution ---
 
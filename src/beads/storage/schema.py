@@ -1,4 +1,15 @@
-"""SQLite schema matching Go's storage/sqlite/schema.go exactly."""
+"""SQLite schema matching Go's storage/sqlite/schema.go exactly.
+
+The one deliberate difference is that timestamp columns carry no
+``DEFAULT CURRENT_TIMESTAMP``: the storage layer always binds an explicit
+RFC3339 string, so statement text stays deterministic and timestamps keep
+sub-second precision.
+
+``EXTRA_INDEXES`` are additions on top of Go's schema. They back the fixed
+``list`` sort orders and the ready-work query so the planner walks an index
+instead of scanning or building a temporary B-tree; extra indexes are
+invisible to the Go binary.
+"""
 
 SCHEMA = """
 -- Issues table
@@ -15,10 +26,10 @@ CREATE TABLE IF NOT EXISTS issues (
     issue_type TEXT NOT NULL DEFAULT 'task',
     assignee TEXT,
     estimated_minutes INTEGER,
-    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL,
     created_by TEXT DEFAULT '',
     owner TEXT DEFAULT '',
-    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL,
     closed_at DATETIME,
     closed_by_session TEXT DEFAULT '',
     close_reason TEXT DEFAULT '',
@@ -87,7 +98,7 @@ CREATE TABLE IF NOT EXISTS dependencies (
     issue_id TEXT NOT NULL,
     depends_on_id TEXT NOT NULL,
     type TEXT NOT NULL DEFAULT 'blocks',
-    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL,
     created_by TEXT NOT NULL,
     metadata TEXT DEFAULT '{}',
     thread_id TEXT DEFAULT '',
@@ -116,7 +127,7 @@ CREATE TABLE IF NOT EXISTS comments (
     issue_id TEXT NOT NULL,
     author TEXT NOT NULL,
     text TEXT NOT NULL,
-    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL,
     FOREIGN KEY (issue_id) REFERENCES issues(id) ON DELETE CASCADE
 );
 
@@ -132,7 +143,7 @@ CREATE TABLE IF NOT EXISTS events (
     old_value TEXT,
     new_value TEXT,
     comment TEXT,
-    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at DATETIME NOT NULL,
     FOREIGN KEY (issue_id) REFERENCES issues(id) ON DELETE CASCADE
 );
 
@@ -154,7 +165,7 @@ CREATE TABLE IF NOT EXISTS metadata (
 -- Dirty issues table (incremental JSONL export)
 CREATE TABLE IF NOT EXISTS dirty_issues (
     issue_id TEXT PRIMARY KEY,
-    marked_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    marked_at DATETIME NOT NULL,
     FOREIGN KEY (issue_id) REFERENCES issues(id) ON DELETE CASCADE
 );
 
@@ -164,7 +175,7 @@ CREATE INDEX IF NOT EXISTS idx_dirty_issues_marked_at ON dirty_issues(marked_at)
 CREATE TABLE IF NOT EXISTS export_hashes (
     issue_id TEXT PRIMARY KEY,
     content_hash TEXT NOT NULL,
-    exported_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    exported_at DATETIME NOT NULL,
     FOREIGN KEY (issue_id) REFERENCES issues(id) ON DELETE CASCADE
 );
 
@@ -178,3 +189,19 @@ CREATE TABLE IF NOT EXISTS child_counters (
 -- Schema version in metadata
 INSERT OR IGNORE INTO metadata (key, value) VALUES ('schema_version', '1');
 """
+
+# Indexes serving SQLiteStorage's list sort orders and ready-work query.
+# SQLite scans an index in either direction, so one index covers both ASC
+# and DESC.
+EXTRA_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_issues_updated_at ON issues(updated_at);
+CREATE INDEX IF NOT EXISTS idx_issues_priority_created_at ON issues(priority, created_at);
+-- Ready work: open issues already in priority order; closed rows are not indexed
+CREATE INDEX IF NOT EXISTS idx_issues_ready ON issues(status, priority, created_at) WHERE status = 'open';
+-- Covers the blocker probe (issue_id, type -> depends_on_id) without a table lookup
+CREATE INDEX IF NOT EXISTS idx_dependencies_issue_type ON dependencies(issue_id, type, depends_on_id);
+-- Case-insensitive partial-ID lookups range-scan this instead of running LIKE
+CREATE INDEX IF NOT EXISTS idx_issues_lower_id ON issues(lower(id));
+"""
+
+SCHEMA += EXTRA_INDEXES
@@ -2,30 +2,454 @@
 
 from __future__ import annotations
 
+import copy
 import json
+import queue
 import sqlite3
+import string
+import threading
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
+from beads.jsonutil import dumps as _dumps, loads as _loads
 from beads.models import (
     Comment, Dependency, DepType, Event, EventType, Issue, IssueFilter,
-    Statistics, Status, format_timestamp, now_utc, parse_timestamp,
+    Statistics, Status, format_timestamp, now_utc,
 )
 from beads.storage.interface import Storage
-from beads.storage.schema import SCHEMA
+from beads.storage.schema import SCHEMA, EXTRA_INDEXES
+
+
+# Stamped into PRAGMA user_version once a database has every column, table
+# and index this module expects; bump it whenever the migration changes.
+_SCHEMA_VERSION = 3
+
+# Rows pulled per fetchmany() call by the iter_* methods.
+FETCH_BATCH = 1024
+
+# Prepared statements sqlite3 keeps per connection (default 100 or 128,
+# depending on the Python version).
+STATEMENT_CACHE_SIZE = 256
+
+# Bound parameters per IN (...) chunk, under SQLite's historical limit of 999.
+MAX_SQL_PARAMS = 900
+
+# Bytes of the database file SQLite may memory-map for reads.
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Issues get_issue keeps hydrated, keyed by ID and validated by updated_at.
+ISSUE_CACHE_SIZE = 512
+
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
+# RETURNING arrived in SQLite 3.35; older libraries read the row back instead.
+# SQLite's lower() folds ASCII only (no ICU); partial IDs are folded to match.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_SQL_BUMP_CHILD_COUNTER = (
+    "INSERT INTO child_counters (parent_id, last_child) VALUES (?, 1) "
+    "ON CONFLICT (parent_id) DO UPDATE SET last_child = last_child + 1"
+)
+
+# Statistics field that get_statistics adds each status's count to
+_STATUS_STAT_FIELDS = {
+    Status.OPEN: "open_issues",
+    Status.IN_PROGRESS: "in_progress_issues",
+    Status.CLOSED: "closed_issues",
+    Status.BLOCKED: "blocked_issues",
+    Status.DEFERRED: "deferred_issues",
+    Status.PINNED: "pinned_issues",
+    Status.TOMBSTONE: "tombstone_issues",
+}
+
+
+# Hot statements kept as module constants so every call passes the same
+# string to sqlite3's statement cache.
+_SQL_INSERT_ISSUE = """INSERT INTO issues (
+    id, content_hash, title, description, design, acceptance_criteria,
+    notes, status, priority, issue_type, assignee, estimated_minutes,
+    created_at, created_by, owner, updated_at, closed_at, closed_by_session,
+    close_reason, external_ref, spec_id, compaction_level, compacted_at,
+    compacted_at_commit, original_size, deleted_at, deleted_by,
+    delete_reason, original_type, sender, ephemeral, wisp_type,
+    pinned, is_template, crystallizes, mol_type, work_type,
+    quality_score, source_system, metadata, event_kind, actor, target,
+    payload, due_at, defer_until, hook_bead, role_bead, agent_state,
+    last_activity, role_type, rig, bonded_from, creator_json,
+    validations_json, await_type, await_id, timeout, waiters_json, holder
+) VALUES (
+    ?, ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?,
+    ?, ?, ?, ?,
+    ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?, ?
+)"""
+_SQL_SELECT_ISSUE_BY_ID = "SELECT {cols} FROM issues i WHERE i.id = ?"
+_SQL_INSERT_EVENT = (
+    "INSERT INTO events (issue_id, event_type, actor, old_value, new_value, comment, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_DEPENDENCY = (
+    "INSERT OR IGNORE INTO dependencies (issue_id, depends_on_id, type, created_at, created_by, metadata, thread_id) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_SELECT_DEPENDENCIES = (
+    "SELECT issue_id, depends_on_id, type, created_at, created_by, metadata, thread_id "
+    "FROM dependencies WHERE issue_id = ?"
+)
+_SQL_REACHES = (
+    "WITH RECURSIVE reach(id) AS ("
+    "SELECT ? UNION SELECT d.depends_on_id FROM dependencies d JOIN reach r ON d.issue_id = r.id"
+    ") SELECT 1 FROM reach WHERE id = ? LIMIT 1"
+)
+_SQL_SELECT_COMMENTS = (
+    "SELECT id, issue_id, author, text, created_at FROM comments "
+    "WHERE issue_id {where} ORDER BY created_at ASC"
+)
+_SQL_SELECT_EVENTS = (
+    "SELECT id, issue_id, event_type, actor, old_value, new_value, comment, created_at "
+    "FROM events WHERE issue_id {where} ORDER BY created_at ASC"
+)
+_SQL_INSERT_LABEL = "INSERT OR IGNORE INTO labels (issue_id, label) VALUES (?, ?)"
+_SQL_INSERT_COMMENT = "INSERT INTO comments (issue_id, author, text, created_at) VALUES (?, ?, ?, ?)"
+# Labels, dependencies and comments per issue, each aggregated into a JSON
+# array (ordered as get_labels / get_dependency_records / get_comments).
+_SQL_SELECT_CHILDREN_JSON = """
+    SELECT i.id,
+        (SELECT json_group_array(label) FROM (
+            SELECT label FROM labels WHERE issue_id = i.id ORDER BY label)),
+        (SELECT json_group_array(json_array(
+            issue_id, depends_on_id, type, created_at, created_by, metadata, thread_id))
+         FROM dependencies WHERE issue_id = i.id),
+        (SELECT json_group_array(json_array(id, issue_id, author, text, created_at))
+         FROM (SELECT * FROM comments WHERE issue_id = i.id ORDER BY created_at ASC))
+    FROM issues i WHERE i.id IN ({ph})
+"""
+
+
+def _sql_literals(values: Iterable[str]) -> str:
+    """Render known constants as the body of a literal SQL IN (...) list."""
+    return ", ".join(f"'{v}'" for v in values)
+
+
+# Built from the model constants once, at import, so the ready and blocked
+# queries stay constant SQL text and cannot drift from DepType
+_SQL_BLOCKING_TYPES = _sql_literals(sorted(DepType._BLOCKING))
+# Statuses of an issue that is not finished, and so still blocks others
+_SQL_UNFINISHED_STATUSES = _sql_literals((
+    Status.OPEN, Status.IN_PROGRESS, Status.BLOCKED, Status.DEFERRED, Status.HOOKED,
+))
+# Ready work: open, not deferred past the bound time, not ephemeral or
+# pinned, and not blocked by an unfinished issue.
+_SQL_READY_WHERE = f"""
+    i.status = 'open'
+      AND (i.ephemeral = 0 OR i.ephemeral IS NULL)
+      AND (i.pinned = 0 OR i.pinned IS NULL)
+      AND (i.defer_until IS NULL OR i.defer_until <= ?)
+      AND i.id NOT IN (
+        -- Uncorrelated: SQLite builds the blocked set once rather
+        -- than probing dependencies per candidate row
+        SELECT d.issue_id FROM dependencies d
+        JOIN issues blocker ON d.depends_on_id = blocker.id
+        WHERE d.type IN ({_SQL_BLOCKING_TYPES})
+          AND blocker.status IN ({_SQL_UNFINISHED_STATUSES})
+      )
+"""
+_SQL_MARK_DIRTY = (
+    "INSERT INTO dirty_issues (issue_id, marked_at) VALUES (?, ?) "
+    "ON CONFLICT (issue_id) DO UPDATE SET marked_at = excluded.marked_at"
+)
+
+
+def _order_by(sort_by: str, reverse: bool) -> str:
+    columns = {
+        "created": ("i.created_at",),
+        "created_at": ("i.created_at",),
+        "updated": ("i.updated_at",),
+        "updated_at": ("i.updated_at",),
+        "priority": ("i.priority", "i.created_at"),
+        "status": ("i.status",),
+        "title": ("i.title",),
+        "id": ("i.id",),
+        "type": ("i.issue_type",),
+    }[sort_by]
+    descending = not reverse
+    if sort_by == "priority":
+        descending = reverse  # Lower number = higher priority
+    direction = "DESC" if descending else "ASC"
+    return ", ".join(f"{col} {direction}" for col in columns)
+
+
+# ORDER BY clause per (sort_by, reverse). Every shape uses a single direction
+# so SQLite can walk idx_issues_* (forwards or backwards) without sorting.
+_LIST_ORDER_BY = {
+    (sort_by, reverse): _order_by(sort_by, reverse)
+    for sort_by in (
+        "created", "created_at", "updated", "updated_at", "priority",
+        "status", "title", "id", "type",
+    )
+    for reverse in (False, True)
+}
+
+
+# IssueFilter terms in clause order: (attribute, activation, clause, binder).
+# _SET terms apply when the value is not None, _ON when truthy, _UNSET when
+# falsy, _LIST when non-empty (one "{ph}" placeholder per item) and _EACH
+# repeat their clause once per item. The binder maps the value to params.
+_SET, _ON, _UNSET, _LIST, _EACH = range(5)
+
+
+def _one(value: Any) -> list[Any]:
+    return [value]
+
+
+def _contains(value: str) -> list[str]:
+    return [f"%{value}%"]
+
+
+def _timestamp(value: datetime) -> list[Any]:
+    return [format_timestamp(value)]
+
+
+def _flag(value: bool) -> list[int]:
+    return [int(value)]
+
+
+_FILTER_TERMS: tuple[tuple[str, int, str, Callable[[Any], list[Any]] | None], ...] = (
+    ("include_tombstones", _UNSET, "i.status != 'tombstone'", None),
+    ("status", _SET, "i.status = ?", _one),
+    ("priority", _SET, "i.priority = ?", _one),
+    ("priority_min", _SET, "i.priority >= ?", _one),
+    ("priority_max", _SET, "i.priority <= ?", _one),
+    ("issue_type", _SET, "i.issue_type = ?", _one),
+    ("assignee", _SET, "i.assignee = ?", _one),
+    ("no_assignee", _ON, "(i.assignee IS NULL OR i.assignee = '')", None),
+    ("title_search", _ON, "(i.title LIKE ? OR i.description LIKE ? OR i.id LIKE ?)",
+     lambda v: _contains(v) * 3),
+    ("title_contains", _ON, "i.title LIKE ?", _contains),
+    ("description_contains", _ON, "i.description LIKE ?", _contains),
+    ("notes_contains", _ON, "i.notes LIKE ?", _contains),
+    ("ids", _LIST, "i.id IN ({ph})", list),
+    ("id_prefix", _ON, "i.id LIKE ?", lambda v: [f"{v}%"]),
+    ("labels", _EACH,
+     "EXISTS (SELECT 1 FROM labels l WHERE l.issue_id = i.id AND l.label = ?)", list),
+    ("labels_any", _LIST,
+     "EXISTS (SELECT 1 FROM labels l WHERE l.issue_id = i.id AND l.label IN ({ph}))", list),
+    ("created_after", _ON, "i.created_at > ?", _timestamp),
+    ("created_before", _ON, "i.created_at < ?", _timestamp),
+    ("updated_after", _ON, "i.updated_at > ?", _timestamp),
+    ("updated_before", _ON, "i.updated_at < ?", _timestamp),
+    ("ephemeral", _SET, "i.ephemeral = ?", _flag),
+    ("pinned", _SET, "i.pinned = ?", _flag),
+    ("is_template", _SET, "i.is_template = ?", _flag),
+    ("exclude_status", _LIST, "i.status NOT IN ({ph})", list),
+    ("exclude_types", _LIST, "i.issue_type NOT IN ({ph})", list),
+    ("parent_id", _SET,
+     "EXISTS (SELECT 1 FROM dependencies d WHERE d.issue_id = i.id "
+     "AND d.depends_on_id = ? AND d.type = 'parent-child')", _one),
+    ("overdue", _ON, "i.due_at IS NOT NULL AND i.due_at < ? AND i.status != 'closed'",
+     lambda v: [format_timestamp(now_utc())]),
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_filter(base_where: str, shape: tuple[tuple[int, int], ...]) -> str:
+    """Render the WHERE clause for one filter shape (see _build_filter_sql)."""
+    clauses = [base_where]
+    for index, count in shape:
+        _, mode, clause, _ = _FILTER_TERMS[index]
+        if mode == _LIST:
+            clauses.append(clause.format(ph=",".join("?" * count)))
+        elif mode == _EACH:
+            clauses.extend([clause] * count)
+        else:
+            clauses.append(clause)
+    return " AND ".join(clauses)
+
+
+def _no_value() -> None:
+    return None
+
+
+# Issue attributes whose issues column is named differently.
+_ISSUE_COLUMN_NAMES = {
+    "creator": "creator_json",
+    "validations": "validations_json",
+    "waiters": "waiters_json",
+}
+
+# Value used when a column is NULL or absent, in Issue._ROW_FIELDS order.
+_ISSUE_FIELD_DEFAULTS = tuple(
+    {
+        "status": Status.OPEN, "priority": 2, "issue_type": "task",
+        "estimated_minutes": None, "external_ref": None,
+        "compaction_level": 0, "compacted_at_commit": None,
+        "original_size": 0, "ephemeral": 0, "pinned": 0, "is_template": 0,
+        "crystallizes": 0, "quality_score": None, "timeout": 0,
+        "created_at": None, "updated_at": None, "closed_at": None,
+        "due_at": None, "defer_until": None, "compacted_at": None,
+        "deleted_at": None, "last_activity": None,
+    }.get(f, "")
+    for f in Issue._ROW_FIELDS
+)
+
+_FIELD_IDX = {f: i for i, f in enumerate(Issue._ROW_FIELDS)}
+_CREATED_AT_IDX = _FIELD_IDX["created_at"]
+_UPDATED_AT_IDX = _FIELD_IDX["updated_at"]
+_BOOL_IDX = tuple(_FIELD_IDX[f] for f in (
+    "ephemeral", "pinned", "is_template", "crystallizes",
+))
+_JSON_IDX = (
+    (_FIELD_IDX["bonded_from"], list),
+    (_FIELD_IDX["creator"], _no_value),
+    (_FIELD_IDX["validations"], list),
+    (_FIELD_IDX["waiters"], list),
+)
+
+
+def _tune_connection(conn: sqlite3.Connection, cache_mib: int) -> None:
+    """Apply the per-connection PRAGMAs shared by writer and readers."""
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA cache_size={-int(cache_mib) * 1024}")
+    conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+
+
+def _copy_issue(issue: Issue) -> Issue:
+    """Copy an issue so callers can mutate it, its lists and children included.
+
+    Labels are strings and can be shared; dependencies, comments and the HOP
+    dicts (bonded_from, validations, creator) are copied one level down so a
+    caller editing them cannot reach the cached original.
+    """
+    clone = copy.copy(issue)
+    clone.__dict__.update(
+        (name, [v if type(v) is str else copy.copy(v) for v in value])
+        for name, value in issue.__dict__.items()
+        if type(value) is list
+    )
+    if issue.creator is not None:
+        clone.creator = dict(issue.creator)
+    return clone
+
+
+class _ReaderPool:
+    """Long-lived read-only connections for SQLiteStorage's query paths.
+
+    WAL lets these read alongside the writer. Idle connections are reused
+    LIFO so the most recently used (warmest) page cache serves the next
+    query. Connections are opened lazily up to ``size``.
+    """
+
+    def __init__(self, db_path: str, size: int, cache_mib: int):
+        self._uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+        self._size = size
+        self._cache_mib = cache_mib
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, block: bool = False) -> sqlite3.Connection | None:
+        """Check out a reader.
+
+        When all of them are in use, wait for one if ``block`` is set and
+        otherwise return None.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._opened) < self._size:
+                conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False,
+                                       cached_statements=STATEMENT_CACHE_SIZE)
+                _tune_connection(conn, self._cache_mib)
+                self._opened.append(conn)
+                return conn
+        return self._idle.get() if block else None
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._opened:
+                conn.close()
+            self._opened.clear()
 
 
 class SQLiteStorage(Storage):
     """SQLite-based storage backend."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, synchronous: str = "NORMAL", cache_mib: int = 64,
+                 readers: int = 4):
+        """Open (creating if needed) the database at db_path.
+
+        synchronous=NORMAL is durable against application crashes under WAL;
+        pass "FULL" to also survive power loss at the cost of an fsync per
+        commit. cache_mib sizes each connection's page cache. readers caps
+        the pool of read-only connections used for queries on file
+        databases (0 sends every query through the writer).
+        """
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"invalid synchronous mode: {synchronous!r}")
+        conn = sqlite3.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        self._open(conn, db_path, synchronous, cache_mib, readers)
+
+    @classmethod
+    def _clone_from(cls, template: SQLiteStorage) -> SQLiteStorage:
+        """Open a ":memory:" store holding a copy of template's database.
+
+        The copy is already at the current schema version, so the schema
+        DDL is skipped; the test fixtures use this for a fresh store per test.
+        """
+        conn = sqlite3.connect(":memory:", cached_statements=STATEMENT_CACHE_SIZE)
+        template._conn.backup(conn)
+        store = cls.__new__(cls)
+        store._open(conn, ":memory:", "NORMAL", 64, 0)
+        return store
+
+    def _open(self, conn: sqlite3.Connection, db_path: str, synchronous: str,
+              cache_mib: int, readers: int) -> None:
         self._db_path = db_path
-        self._conn = sqlite3.connect(db_path)
-        self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn = conn
+        is_file = db_path not in ("", ":memory:")
+        if is_file:
+            # In-memory databases have no WAL; asking would just return "memory"
+            self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
-        self._conn.execute("PRAGMA busy_timeout=5000")
+        # Per-connection tuning; only journal_mode persists in the file.
+        _tune_connection(self._conn, cache_mib)
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.execute("PRAGMA wal_autocheckpoint=1000")
+        self._tx_depth = 0
+        self._owner_thread = threading.get_ident()
+        # issue_id -> (stored updated_at, Issue); see get_issue
+        self._issue_cache: OrderedDict[str, tuple[str, Issue]] = OrderedDict()
+        self._issue_cache_lock = threading.Lock()
+        # Whole config table, loaded on first read; see get_config
+        self._config_cache: dict[str, str] | None = None
         self._init_schema()
+        self._readers: _ReaderPool | None = None
+        if readers > 0 and is_file:
+            self._readers = _ReaderPool(db_path, readers, cache_mib)
+        self._issue_col_exprs = self._issue_select_exprs()
+        self._issue_cols = ", ".join(self._issue_col_exprs.values())
+        self._sql_select_issue_by_id = _SQL_SELECT_ISSUE_BY_ID.format(cols=self._issue_cols)
 
     def _init_schema(self) -> None:
         """Initialize database schema.
@@ -40,9 +464,12 @@ class SQLiteStorage(Storage):
         is_existing = row[0] > 0
 
         if is_existing:
-            self._migrate_existing_schema()
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                self._migrate_existing_schema()
         else:
             self._conn.executescript(SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
             self._conn.commit()
 
     def _migrate_existing_schema(self) -> None:
@@ -74,12 +501,11 @@ class SQLiteStorage(Storage):
             ("holder", "TEXT DEFAULT ''"),
         ]
 
-        for col_name, col_type in issue_columns:
-            if col_name not in existing_cols:
-                try:
+        missing_cols = [(n, t) for n, t in issue_columns if n not in existing_cols]
+        if missing_cols:
+            with self.transaction():
+                for col_name, col_type in missing_cols:
                     self._conn.execute(f"ALTER TABLE issues ADD COLUMN {col_name} {col_type}")
-                except Exception:
-                    pass  # Column may already exist
 
         # Create missing tables (IF NOT EXISTS handles idempotency)
         missing_tables_sql = """
@@ -87,12 +513,12 @@ class SQLiteStorage(Storage):
         CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL);
         CREATE TABLE IF NOT EXISTS dirty_issues (
             issue_id TEXT PRIMARY KEY,
-            marked_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            marked_at DATETIME NOT NULL
         );
         CREATE TABLE IF NOT EXISTS export_hashes (
             issue_id TEXT PRIMARY KEY,
             content_hash TEXT NOT NULL,
-            exported_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            exported_at DATETIME NOT NULL
         );
         CREATE TABLE IF NOT EXISTS child_counters (
             parent_id TEXT PRIMARY KEY,
@@ -101,242 +527,365 @@ class SQLiteStorage(Storage):
         CREATE INDEX IF NOT EXISTS idx_dirty_issues_marked_at ON dirty_issues(marked_at);
         """
         self._conn.executescript(missing_tables_sql)
+        self._conn.executescript(EXTRA_INDEXES)
+        self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
         self._conn.commit()
 
     def path(self) -> str:
         return self._db_path
 
     def close(self) -> None:
+        # Let SQLite refresh planner statistics for tables whose shape the
+        # session's queries suggest has changed; cheap when nothing has.
+        self._conn.execute("PRAGMA optimize")
+        if self._readers is not None:
+            self._readers.close()
         self._conn.close()
 
     # --- Helpers ---
 
-    def _row_to_issue(self, row: sqlite3.Row) -> Issue:
-        """Convert a database row to an Issue object.
+    def _query(self, sql: str, params: Any = (),
+               conn: sqlite3.Connection | None = None) -> sqlite3.Cursor:
+        """Execute a query whose cursor yields plain tuples instead of Rows."""
+        cur = (conn or self._conn).cursor()
+        cur.row_factory = None
+        return cur.execute(sql, params)
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection for read-only queries.
+
+        On the thread that owns the writer, a pooled reader is used unless
+        this is an in-memory database, the pool is exhausted, or the writer
+        holds uncommitted changes that the read must see; those cases read
+        through the writer itself. Other threads cannot touch the writer, so
+        they wait for a pooled reader instead.
+        """
+        conn = None
+        if self._readers is not None:
+            if threading.get_ident() != self._owner_thread:
+                conn = self._readers.acquire(block=True)
+            elif not self._tx_depth and not self._conn.in_transaction:
+                conn = self._readers.acquire()
+        if conn is None:
+            yield self._conn
+            return
+        try:
+            yield conn
+        finally:
+            self._readers.release(conn)
 
-        Handles missing columns gracefully for Go-created databases.
+    def _issue_select_exprs(self) -> dict[str, str]:
+        """Map each Issue field to its select expression, in Issue._ROW_FIELDS order.
+
+        Columns an older Go database lacks are selected as NULL, so that
+        fallback is settled once here instead of on every row.
+        """
+        present = {row[1] for row in self._conn.execute("PRAGMA table_info(issues)")}
+        exprs = {}
+        for field_name in Issue._ROW_FIELDS:
+            col = _ISSUE_COLUMN_NAMES.get(field_name, field_name)
+            exprs[field_name] = f"i.{col}" if col in present else f"NULL AS {col}"
+        return exprs
+
+    def _query_issues(self, sql: str, params: Any = (), children: bool = False) -> list[Issue]:
+        """Run an issues query and hydrate every row."""
+        return list(self._iter_query_issues(sql, params, children))
+
+    def _iter_query_issues(self, sql: str, params: Any = (),
+                           children: bool = False) -> Iterator[Issue]:
+        """Run an issues query, hydrating rows in batches of FETCH_BATCH.
+
+        With ``children``, each batch also gets its labels, dependencies and
+        comments via _load_children_bulk.
+        """
+        with self._reader() as conn:
+            cur = self._query(sql, params, conn)
+            try:
+                row_to_issue = self._row_to_issue
+                while True:
+                    rows = cur.fetchmany(FETCH_BATCH)
+                    if not rows:
+                        break
+                    issues = [row_to_issue(row) for row in rows]
+                    if children:
+                        self._load_children_bulk(issues, conn)
+                    yield from issues
+            finally:
+                cur.close()
+
+    def _load_children_bulk(self, issues: list[Issue],
+                            conn: sqlite3.Connection | None = None) -> None:
+        """Fill labels, dependencies and comments for many issues at once.
+
+        One query per MAX_SQL_PARAMS issues: SQLite's JSON1 aggregates each
+        issue's children into JSON arrays, so Python decodes one column per
+        child kind instead of iterating three result sets.
         """
-        issue = Issue()
-        keys = set(row.keys())
-
-        def get(col: str, default: Any = "") -> Any:
-            return row[col] if col in keys else default
-
-        issue.id = row["id"]
-        issue.content_hash = get("content_hash") or ""
-        issue.title = row["title"]
-        issue.description = get("description") or ""
-        issue.design = get("design") or ""
-        issue.acceptance_criteria = get("acceptance_criteria") or ""
-        issue.notes = get("notes") or ""
-        issue.status = get("status") or Status.OPEN
-        issue.priority = row["priority"]
-        issue.issue_type = get("issue_type") or "task"
-        issue.assignee = get("assignee") or ""
-        issue.estimated_minutes = get("estimated_minutes", None)
-        issue.created_at = parse_timestamp(get("created_at")) or now_utc()
-        issue.created_by = get("created_by") or ""
-        issue.owner = get("owner") or ""
-        issue.updated_at = parse_timestamp(get("updated_at")) or now_utc()
-        issue.closed_at = parse_timestamp(get("closed_at", None))
-        issue.closed_by_session = get("closed_by_session") or ""
-        issue.close_reason = get("close_reason") or ""
-        issue.external_ref = get("external_ref", None)
-        issue.spec_id = get("spec_id") or ""
-        issue.compaction_level = get("compaction_level", 0) or 0
-        issue.compacted_at = parse_timestamp(get("compacted_at", None))
-        issue.compacted_at_commit = get("compacted_at_commit", None)
-        issue.original_size = get("original_size", 0) or 0
-        issue.deleted_at = parse_timestamp(get("deleted_at", None))
-        issue.deleted_by = get("deleted_by") or ""
-        issue.delete_reason = get("delete_reason") or ""
-        issue.original_type = get("original_type") or ""
-        issue.sender = get("sender") or ""
-        issue.ephemeral = bool(get("ephemeral", 0))
-        issue.wisp_type = get("wisp_type") or ""
-        issue.pinned = bool(get("pinned", 0))
-        issue.is_template = bool(get("is_template", 0))
-        issue.crystallizes = bool(get("crystallizes", 0))
-        issue.mol_type = get("mol_type") or ""
-        issue.work_type = get("work_type") or ""
-        issue.quality_score = get("quality_score", None)
-        issue.source_system = get("source_system") or ""
-        issue.metadata = get("metadata") or ""
-        issue.event_kind = get("event_kind") or ""
-        issue.actor = get("actor") or ""
-        issue.target = get("target") or ""
-        issue.payload = get("payload") or ""
-        issue.due_at = parse_timestamp(get("due_at", None))
-        issue.defer_until = parse_timestamp(get("defer_until", None))
-        issue.hook_bead = get("hook_bead") or ""
-        issue.role_bead = get("role_bead") or ""
-        issue.agent_state = get("agent_state") or ""
-        issue.last_activity = parse_timestamp(get("last_activity", None))
-        issue.role_type = get("role_type") or ""
-        issue.rig = get("rig") or ""
-        issue.await_type = get("await_type") or ""
-        issue.await_id = get("await_id") or ""
-        issue.timeout = get("timeout", 0) or 0
-        issue.holder = get("holder") or ""
+        by_id = {issue.id: issue for issue in issues}
+        ids = list(by_id)
+        for start in range(0, len(ids), MAX_SQL_PARAMS):
+            chunk = ids[start:start + MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            for issue_id, labels_json, deps_json, comments_json in self._query(
+                _SQL_SELECT_CHILDREN_JSON.format(ph=placeholders), chunk, conn
+            ):
+                issue = by_id[issue_id]
+                if labels_json != "[]":
+                    issue.labels = _loads(labels_json)
+                if deps_json != "[]":
+                    issue.dependencies = [self._row_to_dependency(d) for d in _loads(deps_json)]
+                if comments_json != "[]":
+                    issue.comments = [self._row_to_comment(c) for c in _loads(comments_json)]
+
+    @staticmethod
+    def _row_to_dependency(row: tuple | list) -> Dependency:
+        """Build a Dependency from a row in _SQL_SELECT_DEPENDENCIES column order."""
+        # created_at stays as stored text; Dependency parses it on first access
+        return Dependency(
+            row[0], row[1], row[2], row[3] or now_utc(),
+            row[4] or "", row[5] or "", row[6] or "",
+        )
 
-        # JSON-stored fields (may not exist in Go DBs)
-        bf = get("bonded_from", "[]") or "[]"
-        try:
-            issue.bonded_from = json.loads(bf) if bf else []
-        except (json.JSONDecodeError, TypeError):
-            issue.bonded_from = []
+    @staticmethod
+    def _row_to_comment(row: tuple | list) -> Comment:
+        """Build a Comment from a row in _SQL_SELECT_COMMENTS column order."""
+        return Comment(row[0], row[1], row[2], row[3], row[4] or now_utc())
 
-        cj = get("creator_json", "") or ""
-        try:
-            issue.creator = json.loads(cj) if cj else None
-        except (json.JSONDecodeError, TypeError):
-            issue.creator = None
+    def _row_to_issue(self, raw: tuple) -> Issue:
+        """Convert a row selected with self._issue_cols to an Issue.
 
-        vj = get("validations_json", "[]") or "[]"
-        try:
-            issue.validations = json.loads(vj) if vj else []
-        except (json.JSONDecodeError, TypeError):
-            issue.validations = []
+        NULL or missing columns fall back to the field's storage default,
+        which handles Go-created databases gracefully.
+        """
+        values = [
+            default if v is None else v
+            for v, default in zip(raw, _ISSUE_FIELD_DEFAULTS)
+        ]
+        # Timestamps stay as stored text; Issue parses them on first access.
+        if not values[_CREATED_AT_IDX]:
+            values[_CREATED_AT_IDX] = now_utc()
+        if not values[_UPDATED_AT_IDX]:
+            values[_UPDATED_AT_IDX] = now_utc()
+        for i in _BOOL_IDX:
+            values[i] = bool(values[i])
 
-        wj = get("waiters_json", "[]") or "[]"
-        try:
-            issue.waiters = json.loads(wj) if wj else []
-        except (json.JSONDecodeError, TypeError):
-            issue.waiters = []
+        # JSON-stored fields (may not exist in Go DBs)
+        for i, empty in _JSON_IDX:
+            raw_json = values[i]
+            try:
+                values[i] = _loads(raw_json) if raw_json else empty()
+            except (json.JSONDecodeError, TypeError):
+                values[i] = empty()
+
+        return Issue._from_row(values)
+
+    def _existing_ids(self, issue_ids: set[str]) -> set[str]:
+        """Return the subset of issue_ids present in the issues table."""
+        ids = list(issue_ids)
+        found: set[str] = set()
+        for start in range(0, len(ids), MAX_SQL_PARAMS):
+            chunk = ids[start:start + MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                row[0] for row in self._query(
+                    f"SELECT id FROM issues WHERE id IN ({placeholders})", chunk
+                )
+            )
+        return found
 
-        return issue
+    def _rows_for_issues(self, sql: str, issue_ids: Iterable[str]) -> list[tuple]:
+        """Run ``sql`` once per MAX_SQL_PARAMS chunk of issue_ids.
+
+        ``sql`` has an ``IN ({ph})`` placeholder for each chunk. Ordering
+        holds within each issue, since every issue's rows land in one chunk.
+        """
+        ids = list(dict.fromkeys(issue_ids))
+        rows: list[tuple] = []
+        with self._reader() as conn:
+            for start in range(0, len(ids), MAX_SQL_PARAMS):
+                chunk = ids[start:start + MAX_SQL_PARAMS]
+                query = sql.format(ph=",".join("?" * len(chunk)))
+                rows.extend(self._query(query, chunk, conn).fetchall())
+        return rows
 
     def _record_event(self, issue_id: str, event_type: str, actor: str,
                       old_value: str | None = None, new_value: str | None = None,
-                      comment: str | None = None) -> None:
-        """Record an audit trail event."""
+                      comment: str | None = None, created_at: str | None = None) -> None:
+        """Record an audit trail event.
+
+        ``created_at`` lets callers share one timestamp across every row they
+        write; it defaults to the current time.
+        """
         self._conn.execute(
-            "INSERT INTO events (issue_id, event_type, actor, old_value, new_value, comment, created_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _SQL_INSERT_EVENT,
             (issue_id, event_type, actor, old_value, new_value, comment,
-             format_timestamp(now_utc()))
+             created_at or format_timestamp(now_utc()))
         )
 
     # --- Issue CRUD ---
 
     def create_issue(self, issue: Issue, actor: str) -> None:
-        issue.content_hash = issue.compute_content_hash()
-        now = now_utc()
-        if not issue.created_at:
-            issue.created_at = now
-        if not issue.updated_at:
-            issue.updated_at = now
+        self.create_issues_bulk([issue], actor)
 
-        self._conn.execute(
-            """INSERT INTO issues (
-                id, content_hash, title, description, design, acceptance_criteria,
-                notes, status, priority, issue_type, assignee, estimated_minutes,
-                created_at, created_by, owner, updated_at, closed_at, closed_by_session,
-                close_reason, external_ref, spec_id, compaction_level, compacted_at,
-                compacted_at_commit, original_size, deleted_at, deleted_by,
-                delete_reason, original_type, sender, ephemeral, wisp_type,
-                pinned, is_template, crystallizes, mol_type, work_type,
-                quality_score, source_system, metadata, event_kind, actor, target,
-                payload, due_at, defer_until, hook_bead, role_bead, agent_state,
-                last_activity, role_type, rig, bonded_from, creator_json,
-                validations_json, await_type, await_id, timeout, waiters_json, holder
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?
-            )""",
-            (
-                issue.id, issue.content_hash, issue.title, issue.description,
-                issue.design, issue.acceptance_criteria, issue.notes,
-                issue.status, issue.priority, issue.issue_type,
-                issue.assignee or None, issue.estimated_minutes,
-                format_timestamp(issue.created_at), issue.created_by,
-                issue.owner, format_timestamp(issue.updated_at),
-                format_timestamp(issue.closed_at),
-                issue.closed_by_session, issue.close_reason,
-                issue.external_ref, issue.spec_id,
-                issue.compaction_level, format_timestamp(issue.compacted_at),
-                issue.compacted_at_commit, issue.original_size,
-                format_timestamp(issue.deleted_at), issue.deleted_by,
-                issue.delete_reason, issue.original_type,
-                issue.sender, int(issue.ephemeral), issue.wisp_type,
-                int(issue.pinned), int(issue.is_template),
-                int(issue.crystallizes), issue.mol_type, issue.work_type,
-                issue.quality_score, issue.source_system,
-                issue.metadata or "{}", issue.event_kind, issue.actor,
-                issue.target, issue.payload,
-                format_timestamp(issue.due_at), format_timestamp(issue.defer_until),
-                issue.hook_bead, issue.role_bead, issue.agent_state,
-                format_timestamp(issue.last_activity), issue.role_type, issue.rig,
-                json.dumps(issue.bonded_from),
-                json.dumps(issue.creator) if issue.creator else "",
-                json.dumps(issue.validations),
-                issue.await_type, issue.await_id, issue.timeout,
-                json.dumps(issue.waiters), issue.holder,
+    def create_issues_bulk(self, issues: list[Issue], actor: str) -> None:
+        """Create many issues, writing each table with one executemany.
+
+        All issue rows go in before any dependency, so edges between
+        issues of the same batch are kept regardless of their order.
+        """
+        if not issues:
+            return
+        now = now_utc()
+        now_str = format_timestamp(now)
+        for issue in issues:
+            issue.content_hash = issue.compute_content_hash()
+            if not issue.created_at:
+                issue.created_at = now
+            if not issue.updated_at:
+                issue.updated_at = now
+        issue_ids = [issue.id for issue in issues]
+        deps = [dep for issue in issues for dep in issue.dependencies]
+
+        # One transaction for the rows and their children (a savepoint when
+        # nested inside a caller's transaction).
+        with self.transaction():
+            self._conn.executemany(
+                _SQL_INSERT_ISSUE, [self._issue_insert_params(issue) for issue in issues]
             )
-        )
 
-        # Import labels
-        for label in issue.labels:
-            self._conn.execute(
-                "INSERT OR IGNORE INTO labels (issue_id, label) VALUES (?, ?)",
-                (issue.id, label)
+            # Import labels
+            self._conn.executemany(
+                _SQL_INSERT_LABEL,
+                [(issue.id, label) for issue in issues for label in issue.labels]
             )
 
-        # Import dependencies
-        for dep in issue.dependencies:
-            try:
-                self._conn.execute(
-                    "INSERT OR IGNORE INTO dependencies (issue_id, depends_on_id, type, created_at, created_by, metadata, thread_id) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
-                    (dep.issue_id, dep.depends_on_id, dep.type,
-                     format_timestamp(dep.created_at), dep.created_by,
-                     dep.metadata, dep.thread_id)
+            # Import dependencies, skipping edges whose endpoint doesn't exist
+            # (OR IGNORE does not cover FK violations)
+            if deps:
+                known = self._existing_ids(
+                    {d.issue_id for d in deps} | {d.depends_on_id for d in deps}
+                )
+                self._conn.executemany(
+                    _SQL_INSERT_DEPENDENCY,
+                    [
+                        (dep.issue_id, dep.depends_on_id, dep.type,
+                         format_timestamp(dep.created_at) or now_str, dep.created_by,
+                         dep.metadata, dep.thread_id)
+                        for dep in deps
+                        if dep.issue_id in known and dep.depends_on_id in known
+                    ]
                 )
-            except sqlite3.IntegrityError:
-                pass  # FK constraint - target doesn't exist yet
 
-        # Import comments
-        for comment in issue.comments:
-            self._conn.execute(
-                "INSERT INTO comments (issue_id, author, text, created_at) VALUES (?, ?, ?, ?)",
-                (comment.issue_id or issue.id, comment.author, comment.text,
-                 format_timestamp(comment.created_at))
+            # Import comments
+            self._conn.executemany(
+                _SQL_INSERT_COMMENT,
+                [
+                    (comment.issue_id or issue.id, comment.author, comment.text,
+                     format_timestamp(comment.created_at) or now_str)
+                    for issue in issues for comment in issue.comments
+                ]
             )
 
-        self._record_event(issue.id, EventType.CREATED, actor)
-        self.mark_dirty(issue.id)
-        self._conn.commit()
+            self._conn.executemany(
+                _SQL_INSERT_EVENT,
+                [(issue_id, EventType.CREATED, actor, None, None, None, now_str)
+                 for issue_id in issue_ids]
+            )
+            self._mark_dirty_many(issue_ids, now_str)
+            self._forget_issues(*issue_ids)
+
+    @staticmethod
+    def _issue_insert_params(issue: Issue) -> tuple:
+        """Bind values for _SQL_INSERT_ISSUE, in its column order."""
+        return (
+            issue.id, issue.content_hash, issue.title, issue.description,
+            issue.design, issue.acceptance_criteria, issue.notes,
+            issue.status, issue.priority, issue.issue_type,
+            issue.assignee or None, issue.estimated_minutes,
+            format_timestamp(issue.created_at), issue.created_by,
+            issue.owner, format_timestamp(issue.updated_at),
+            format_timestamp(issue.closed_at),
+            issue.closed_by_session, issue.close_reason,
+            issue.external_ref, issue.spec_id,
+            issue.compaction_level, format_timestamp(issue.compacted_at),
+            issue.compacted_at_commit, issue.original_size,
+            format_timestamp(issue.deleted_at), issue.deleted_by,
+            issue.delete_reason, issue.original_type,
+            issue.sender, int(issue.ephemeral), issue.wisp_type,
+            int(issue.pinned), int(issue.is_template),
+            int(issue.crystallizes), issue.mol_type, issue.work_type,
+            issue.quality_score, issue.source_system,
+            issue.metadata or "{}", issue.event_kind, issue.actor,
+            issue.target, issue.payload,
+            format_timestamp(issue.due_at), format_timestamp(issue.defer_until),
+            issue.hook_bead, issue.role_bead, issue.agent_state,
+            format_timestamp(issue.last_activity), issue.role_type, issue.rig,
+            _dumps(issue.bonded_from),
+            _dumps(issue.creator) if issue.creator else "",
+            _dumps(issue.validations),
+            issue.await_type, issue.await_id, issue.timeout,
+            _dumps(issue.waiters), issue.holder,
+        )
 
     def get_issue(self, issue_id: str) -> Issue | None:
-        row = self._conn.execute(
-            "SELECT * FROM issues WHERE id = ?", (issue_id,)
-        ).fetchone()
-        if row is None:
-            return None
-        issue = self._row_to_issue(row)
-        # Load labels
-        issue.labels = self.get_labels(issue_id)
-        # Load dependencies
-        issue.dependencies = self.get_dependency_records(issue_id)
-        # Load comments
-        issue.comments = self.get_comments(issue_id)
+        """Fetch one issue with its labels, dependencies and comments.
+
+        Recently fetched issues are served from an LRU while their stored
+        updated_at is unchanged. Writes through this store evict the issues
+        they touch; child-row edits by another process that leave
+        updated_at alone are not seen until the entry is evicted. On a
+        cache miss the fingerprint and the full row are read in one read
+        transaction, so a concurrent commit cannot land between them.
+        """
+        with self._reader() as conn:
+            # Outside the writer's own transaction, pin one snapshot
+            snapshot = not conn.in_transaction
+            if snapshot:
+                conn.execute("BEGIN")
+            try:
+                row = self._query(
+                    "SELECT updated_at FROM issues WHERE id = ?", (issue_id,), conn
+                ).fetchone()
+                if row is None:
+                    self._forget_issues(issue_id)
+                    return None
+                fingerprint = row[0]
+                with self._issue_cache_lock:
+                    cached = self._issue_cache.get(issue_id)
+                    if cached is not None and cached[0] == fingerprint:
+                        self._issue_cache.move_to_end(issue_id)
+                        return _copy_issue(cached[1])
+                row = self._query(self._sql_select_issue_by_id, (issue_id,), conn).fetchone()
+                if row is None:
+                    return None
+                issue = self._row_to_issue(row)
+                self._load_children_bulk([issue], conn)
+            finally:
+                if snapshot:
+                    conn.execute("COMMIT")
+        with self._issue_cache_lock:
+            self._issue_cache[issue_id] = (fingerprint, _copy_issue(issue))
+            self._issue_cache.move_to_end(issue_id)
+            if len(self._issue_cache) > ISSUE_CACHE_SIZE:
+                self._issue_cache.popitem(last=False)
         return issue
 
+    def _forget_issues(self, *issue_ids: str) -> None:
+        """Drop cached copies of the given issues, or of every issue if none given."""
+        with self._issue_cache_lock:
+            if not issue_ids:
+                self._issue_cache.clear()
+            for issue_id in issue_ids:
+                self._issue_cache.pop(issue_id, None)
+
     def update_issue(self, issue_id: str, updates: dict[str, Any], actor: str) -> None:
         # Fetch current for event recording
         current = self.get_issue(issue_id)
         if current is None:
             raise ValueError(f"Issue not found: {issue_id}")
 
+        now_str = format_timestamp(now_utc())
         set_clauses = []
         params: list[Any] = []
 
@@ -359,7 +908,9 @@ class SQLiteStorage(Storage):
             "payload": "payload", "holder": "holder",
         }
 
-        for key, value in updates.items():
+        # Sorted so the same set of fields always yields the same SQL text
+        # and reuses its cached prepared statement.
+        for key, value in sorted(updates.items()):
             col = field_map.get(key, key)
             if col in ("pinned", "is_template", "ephemeral", "crystallizes"):
                 value = int(bool(value)) if value is not None else 0
@@ -371,7 +922,7 @@ class SQLiteStorage(Storage):
 
         # Always update updated_at
         set_clauses.append("updated_at = ?")
-        params.append(format_timestamp(now_utc()))
+        params.append(now_str)
 
         # Recompute content hash
         for key, value in updates.items():
@@ -389,213 +940,127 @@ class SQLiteStorage(Storage):
         if "status" in updates:
             old_status = getattr(current, "status", "")
             self._record_event(issue_id, EventType.STATUS_CHANGED, actor,
-                               old_status, updates["status"])
+                               old_status, updates["status"], created_at=now_str)
         else:
-            self._record_event(issue_id, EventType.UPDATED, actor)
+            self._record_event(issue_id, EventType.UPDATED, actor, created_at=now_str)
 
-        self.mark_dirty(issue_id)
-        self._conn.commit()
+        self._mark_dirty(issue_id, now_str)
+        self._forget_issues(issue_id)
+        self._commit()
 
     def close_issue(self, issue_id: str, reason: str, actor: str) -> None:
-        now = now_utc()
+        now_str = format_timestamp(now_utc())
         self._conn.execute(
             "UPDATE issues SET status = ?, closed_at = ?, close_reason = ?, updated_at = ? WHERE id = ?",
-            (Status.CLOSED, format_timestamp(now), reason, format_timestamp(now), issue_id)
+            (Status.CLOSED, now_str, reason, now_str, issue_id)
         )
-        self._record_event(issue_id, EventType.CLOSED, actor, comment=reason)
-        self.mark_dirty(issue_id)
-        self._conn.commit()
+        self._record_event(issue_id, EventType.CLOSED, actor, comment=reason,
+                           created_at=now_str)
+        self._mark_dirty(issue_id, now_str)
+        self._forget_issues(issue_id)
+        self._commit()
 
     def reopen_issue(self, issue_id: str, actor: str) -> None:
-        now = now_utc()
+        now_str = format_timestamp(now_utc())
         self._conn.execute(
             "UPDATE issues SET status = ?, closed_at = NULL, close_reason = '', updated_at = ? WHERE id = ?",
-            (Status.OPEN, format_timestamp(now), issue_id)
+            (Status.OPEN, now_str, issue_id)
         )
-        self._record_event(issue_id, EventType.REOPENED, actor)
-        self.mark_dirty(issue_id)
-        self._conn.commit()
+        self._record_event(issue_id, EventType.REOPENED, actor, created_at=now_str)
+        self._mark_dirty(issue_id, now_str)
+        self._forget_issues(issue_id)
+        self._commit()
 
     def delete_issue(self, issue_id: str) -> None:
         self._conn.execute("DELETE FROM issues WHERE id = ?", (issue_id,))
-        self._conn.commit()
+        # Cascades into other issues' dependency rows
+        self._forget_issues()
+        self._commit()
 
     # --- Query ---
 
     def _build_filter_sql(self, f: IssueFilter, base_where: str = "1=1") -> tuple[str, list[Any]]:
-        """Build WHERE clause from IssueFilter."""
-        clauses = [base_where]
-        params: list[Any] = []
-
-        if not f.include_tombstones:
-            clauses.append("i.status != 'tombstone'")
-
-        if f.status is not None:
-            clauses.append("i.status = ?")
-            params.append(f.status)
-
-        if f.priority is not None:
-            clauses.append("i.priority = ?")
-            params.append(f.priority)
-
-        if f.priority_min is not None:
-            clauses.append("i.priority >= ?")
-            params.append(f.priority_min)
-
-        if f.priority_max is not None:
-            clauses.append("i.priority <= ?")
-            params.append(f.priority_max)
-
-        if f.issue_type is not None:
-            clauses.append("i.issue_type = ?")
-            params.append(f.issue_type)
-
-        if f.assignee is not None:
-            clauses.append("i.assignee = ?")
-            params.append(f.assignee)
-
-        if f.no_assignee:
-            clauses.append("(i.assignee IS NULL OR i.assignee = '')")
-
-        if f.title_search:
-            clauses.append("(i.title LIKE ? OR i.description LIKE ? OR i.id LIKE ?)")
-            pattern = f"%{f.title_search}%"
-            params.extend([pattern, pattern, pattern])
-
-        if f.title_contains:
-            clauses.append("i.title LIKE ?")
-            params.append(f"%{f.title_contains}%")
-
-        if f.description_contains:
-            clauses.append("i.description LIKE ?")
-            params.append(f"%{f.description_contains}%")
-
-        if f.notes_contains:
-            clauses.append("i.notes LIKE ?")
-            params.append(f"%{f.notes_contains}%")
+        """Build WHERE clause from IssueFilter.
 
-        if f.ids:
-            placeholders = ",".join("?" * len(f.ids))
-            clauses.append(f"i.id IN ({placeholders})")
-            params.extend(f.ids)
-
-        if f.id_prefix:
-            clauses.append("i.id LIKE ?")
-            params.append(f"{f.id_prefix}%")
-
-        if f.labels:
-            for label in f.labels:
-                clauses.append("EXISTS (SELECT 1 FROM labels l WHERE l.issue_id = i.id AND l.label = ?)")
-                params.append(label)
-
-        if f.labels_any:
-            placeholders = ",".join("?" * len(f.labels_any))
-            clauses.append(f"EXISTS (SELECT 1 FROM labels l WHERE l.issue_id = i.id AND l.label IN ({placeholders}))")
-            params.extend(f.labels_any)
-
-        if f.created_after:
-            clauses.append("i.created_at > ?")
-            params.append(format_timestamp(f.created_after))
-
-        if f.created_before:
-            clauses.append("i.created_at < ?")
-            params.append(format_timestamp(f.created_before))
-
-        if f.updated_after:
-            clauses.append("i.updated_at > ?")
-            params.append(format_timestamp(f.updated_after))
-
-        if f.updated_before:
-            clauses.append("i.updated_at < ?")
-            params.append(format_timestamp(f.updated_before))
-
-        if f.ephemeral is not None:
-            clauses.append("i.ephemeral = ?")
-            params.append(int(f.ephemeral))
-
-        if f.pinned is not None:
-            clauses.append("i.pinned = ?")
-            params.append(int(f.pinned))
-
-        if f.is_template is not None:
-            clauses.append("i.is_template = ?")
-            params.append(int(f.is_template))
-
-        if f.exclude_status:
-            placeholders = ",".join("?" * len(f.exclude_status))
-            clauses.append(f"i.status NOT IN ({placeholders})")
-            params.extend(f.exclude_status)
-
-        if f.exclude_types:
-            placeholders = ",".join("?" * len(f.exclude_types))
-            clauses.append(f"i.issue_type NOT IN ({placeholders})")
-            params.extend(f.exclude_types)
-
-        if f.parent_id is not None:
-            clauses.append("EXISTS (SELECT 1 FROM dependencies d WHERE d.issue_id = i.id AND d.depends_on_id = ? AND d.type = 'parent-child')")
-            params.append(f.parent_id)
-
-        if f.overdue:
-            clauses.append("i.due_at IS NOT NULL AND i.due_at < ? AND i.status != 'closed'")
-            params.append(format_timestamp(now_utc()))
-
-        where = " AND ".join(clauses)
-        return where, params
-
-    def search_issues(self, query: str, filter: IssueFilter) -> list[Issue]:
+        Params are bound on every call, but the clause text is compiled once
+        per filter shape (which terms are active, and how many placeholders
+        each list term needs) and reused from _compile_filter's cache.
+        """
+        shape: list[tuple[int, int]] = []
+        params: list[Any] = []
+        for index, (attr, mode, _, bind) in enumerate(_FILTER_TERMS):
+            value = getattr(f, attr)
+            if mode == _SET:
+                if value is None:
+                    continue
+            elif mode == _UNSET:
+                if value:
+                    continue
+            elif not value:
+                continue
+            count = len(value) if mode in (_LIST, _EACH) else 0
+            shape.append((index, count))
+            if bind is not None:
+                params.extend(bind(value))
+        return _compile_filter(base_where, tuple(shape)), params
+
+    @staticmethod
+    def _search_filter(query: str, filter: IssueFilter) -> IssueFilter:
+        """Narrow filter to a text query; both search methods go through here."""
         if query:
             filter.title_search = query
-        where, params = self._build_filter_sql(filter)
-        sql = f"SELECT * FROM issues i WHERE {where} ORDER BY i.created_at DESC"
-        if filter.limit > 0:
-            sql += f" LIMIT {filter.limit}"
-        rows = self._conn.execute(sql, params).fetchall()
-        return [self._row_to_issue(row) for row in rows]
+        return filter
+
+    def search_issues(self, query: str, filter: IssueFilter) -> list[Issue]:
+        return list(self.iter_issues(self._search_filter(query, filter)))
+
+    def search_issues_projected(self, fields: tuple[str, ...], query: str,
+                                filter: IssueFilter) -> list[tuple]:
+        """Like search_issues, but return raw ``fields`` tuples; see list_issues_projected."""
+        return self.list_issues_projected(fields, self._search_filter(query, filter))
 
     def list_issues(self, filter: IssueFilter, sort_by: str = "created_at",
                     reverse: bool = False) -> list[Issue]:
+        return list(self.iter_issues(filter, sort_by=sort_by, reverse=reverse))
+
+    def iter_issues(self, filter: IssueFilter, sort_by: str = "created_at",
+                    reverse: bool = False) -> Iterator[Issue]:
         where, params = self._build_filter_sql(filter)
+        order_by = _LIST_ORDER_BY.get((sort_by, reverse)) or _LIST_ORDER_BY["created_at", reverse]
 
-        # Map sort field names
-        sort_map = {
-            "created": "i.created_at",
-            "created_at": "i.created_at",
-            "updated": "i.updated_at",
-            "updated_at": "i.updated_at",
-            "priority": "i.priority",
-            "status": "i.status",
-            "title": "i.title",
-            "id": "i.id",
-            "type": "i.issue_type",
-        }
-        order_col = sort_map.get(sort_by, "i.created_at")
-        order_dir = "ASC" if reverse else "DESC"
-        if sort_by == "priority":
-            order_dir = "DESC" if reverse else "ASC"  # Lower number = higher priority
+        sql = f"SELECT {self._issue_cols} FROM issues i WHERE {where} ORDER BY {order_by}"
+        if filter.limit > 0:
+            # Bound, not inlined, so each limit shares one cached statement
+            sql += " LIMIT ?"
+            params.append(filter.limit)
+        return self._iter_query_issues(sql, params, children=True)
+
+    def list_issues_projected(self, fields: tuple[str, ...], filter: IssueFilter,
+                              sort_by: str = "created_at",
+                              reverse: bool = False) -> list[tuple]:
+        """Like list_issues, but return only ``fields`` of each row as raw tuples.
+
+        Values come back exactly as stored (timestamps as text, flags as
+        ints, NULLs as None); no Issue is built and no children are loaded.
+        """
+        try:
+            cols = ", ".join(self._issue_col_exprs[name] for name in fields)
+        except KeyError as e:
+            raise ValueError(f"Unknown issue field: {e.args[0]}") from None
+        where, params = self._build_filter_sql(filter)
+        order_by = _LIST_ORDER_BY.get((sort_by, reverse)) or _LIST_ORDER_BY["created_at", reverse]
 
-        sql = f"SELECT * FROM issues i WHERE {where} ORDER BY {order_col} {order_dir}"
+        sql = f"SELECT {cols} FROM issues i WHERE {where} ORDER BY {order_by}"
         if filter.limit > 0:
-            sql += f" LIMIT {filter.limit}"
-        rows = self._conn.execute(sql, params).fetchall()
-        return [self._row_to_issue(row) for row in rows]
+            sql += " LIMIT ?"
+            params.append(filter.limit)
+        with self._reader() as conn:
+            return self._query(sql, params, conn).fetchall()
 
     def get_ready_work(self, filter: dict[str, Any] | None = None) -> list[Issue]:
         """Get issues ready to work on: open, not blocked, not deferred, not ephemeral."""
         now = format_timestamp(now_utc())
-        sql = """
-            SELECT i.* FROM issues i
-            WHERE i.status = 'open'
-              AND (i.ephemeral = 0 OR i.ephemeral IS NULL)
-              AND (i.pinned = 0 OR i.pinned IS NULL)
-              AND (i.defer_until IS NULL OR i.defer_until <= ?)
-              AND NOT EXISTS (
-                SELECT 1 FROM dependencies d
-                JOIN issues blocker ON d.depends_on_id = blocker.id
-                WHERE d.issue_id = i.id
-                  AND d.type IN ('blocks', 'parent-child', 'conditional-blocks', 'waits-for')
-                  AND blocker.status IN ('open', 'in_progress', 'blocked', 'deferred', 'hooked')
-              )
-        """
+        sql = f"SELECT {self._issue_cols} FROM issues i WHERE {_SQL_READY_WHERE}"
         params: list[Any] = [now]
 
         if filter:
@@ -619,29 +1084,30 @@ class SQLiteStorage(Storage):
         sql += " ORDER BY i.priority ASC, i.created_at ASC"
 
         if filter and filter.get("limit"):
-            sql += f" LIMIT {filter['limit']}"
+            sql += " LIMIT ?"
+            params.append(filter["limit"])
 
-        rows = self._conn.execute(sql, params).fetchall()
-        return [self._row_to_issue(row) for row in rows]
+        return self._query_issues(sql, params, children=True)
 
     def get_blocked_issues(self) -> list[tuple[Issue, list[str]]]:
-        sql = """
-            SELECT i.*, GROUP_CONCAT(d.depends_on_id) as blocker_ids
+        sql = f"""
+            SELECT {self._issue_cols}, GROUP_CONCAT(d.depends_on_id) as blocker_ids
             FROM issues i
             JOIN dependencies d ON i.id = d.issue_id
             JOIN issues blocker ON d.depends_on_id = blocker.id
-            WHERE i.status IN ('open', 'in_progress', 'blocked', 'deferred', 'hooked')
-              AND d.type IN ('blocks', 'parent-child', 'conditional-blocks', 'waits-for')
-              AND blocker.status IN ('open', 'in_progress', 'blocked', 'deferred', 'hooked')
+            WHERE i.status IN ({_SQL_UNFINISHED_STATUSES})
+              AND d.type IN ({_SQL_BLOCKING_TYPES})
+              AND blocker.status IN ({_SQL_UNFINISHED_STATUSES})
             GROUP BY i.id
             ORDER BY i.priority ASC, i.created_at ASC
         """
-        rows = self._conn.execute(sql).fetchall()
         result = []
-        for row in rows:
-            issue = self._row_to_issue(row)
-            blocker_ids = (row["blocker_ids"] or "").split(",")
-            result.append((issue, blocker_ids))
+        with self._reader() as conn:
+            for row in self._query(sql, conn=conn):
+                issue = self._row_to_issue(row)
+                blocker_ids = (row[-1] or "").split(",")
+                result.append((issue, blocker_ids))
+            self._load_children_bulk([issue for issue, _ in result], conn)
         return result
 
     # --- Dependencies ---
@@ -653,201 +1119,253 @@ class SQLiteStorage(Storage):
                 f"Adding dependency {dep.issue_id} -> {dep.depends_on_id} would create a cycle"
             )
         self._conn.execute(
-            "INSERT OR IGNORE INTO dependencies (issue_id, depends_on_id, type, created_at, created_by, metadata, thread_id) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _SQL_INSERT_DEPENDENCY,
             (dep.issue_id, dep.depends_on_id, dep.type,
              format_timestamp(dep.created_at), dep.created_by or actor,
              dep.metadata, dep.thread_id)
         )
+        now_str = format_timestamp(now_utc())
         self._record_event(dep.issue_id, EventType.DEPENDENCY_ADDED, actor,
-                           new_value=dep.depends_on_id)
-        self.mark_dirty(dep.issue_id)
-        self.mark_dirty(dep.depends_on_id)
-        self._conn.commit()
+                           new_value=dep.depends_on_id, created_at=now_str)
+        self._mark_dirty_many((dep.issue_id, dep.depends_on_id), now_str)
+        self._forget_issues(dep.issue_id)
+        self._commit()
 
     def remove_dependency(self, issue_id: str, depends_on_id: str, actor: str) -> None:
         self._conn.execute(
             "DELETE FROM dependencies WHERE issue_id = ? AND depends_on_id = ?",
             (issue_id, depends_on_id)
         )
+        now_str = format_timestamp(now_utc())
         self._record_event(issue_id, EventType.DEPENDENCY_REMOVED, actor,
-                           old_value=depends_on_id)
-        self.mark_dirty(issue_id)
-        self.mark_dirty(depends_on_id)
-        self._conn.commit()
+                           old_value=depends_on_id, created_at=now_str)
+        self._mark_dirty_many((issue_id, depends_on_id), now_str)
+        self._forget_issues(issue_id)
+        self._commit()
 
     def get_dependencies(self, issue_id: str) -> list[Issue]:
-        rows = self._conn.execute(
-            "SELECT i.* FROM issues i JOIN dependencies d ON i.id = d.depends_on_id "
+        return self._query_issues(
+            f"SELECT {self._issue_cols} FROM issues i JOIN dependencies d ON i.id = d.depends_on_id "
             "WHERE d.issue_id = ?",
             (issue_id,)
-        ).fetchall()
-        return [self._row_to_issue(row) for row in rows]
+        )
 
     def get_dependents(self, issue_id: str) -> list[Issue]:
-        rows = self._conn.execute(
-            "SELECT i.* FROM issues i JOIN dependencies d ON i.id = d.issue_id "
+        return self._query_issues(
+            f"SELECT {self._issue_cols} FROM issues i JOIN dependencies d ON i.id = d.issue_id "
             "WHERE d.depends_on_id = ?",
             (issue_id,)
-        ).fetchall()
-        return [self._row_to_issue(row) for row in rows]
+        )
 
     def get_dependency_records(self, issue_id: str) -> list[Dependency]:
-        rows = self._conn.execute(
-            "SELECT * FROM dependencies WHERE issue_id = ?", (issue_id,)
-        ).fetchall()
-        return [
-            Dependency(
-                issue_id=row["issue_id"],
-                depends_on_id=row["depends_on_id"],
-                type=row["type"],
-                created_at=parse_timestamp(row["created_at"]) or now_utc(),
-                created_by=row["created_by"] or "",
-                metadata=row["metadata"] or "",
-                thread_id=row["thread_id"] or "",
-            )
-            for row in rows
-        ]
+        with self._reader() as conn:
+            rows = self._query(_SQL_SELECT_DEPENDENCIES, (issue_id,), conn).fetchall()
+        return [self._row_to_dependency(row) for row in rows]
 
     def has_cycle(self, issue_id: str, depends_on_id: str) -> bool:
         """Check if adding issue_id → depends_on_id would create a cycle.
 
-        Uses recursive CTE to walk the dependency graph from depends_on_id
-        and check if it reaches issue_id.
+        One recursive query walks the edges reachable from depends_on_id
+        inside SQLite, following idx_dependencies_issue; UNION visits each
+        issue once, so the walk is O(reachable edges) and ends on cycles.
+        Runs on the writer so pending edges in a transaction are seen.
         """
         # If they're the same, it's a self-cycle
         if issue_id == depends_on_id:
             return True
-        row = self._conn.execute("""
-            WITH RECURSIVE reachable(id, depth) AS (
-                SELECT ?, 0
-                UNION ALL
-                SELECT d.depends_on_id, r.depth + 1
-                FROM reachable r
-                JOIN dependencies d ON d.issue_id = r.id
-                WHERE r.depth < 100
-            )
-            SELECT 1 FROM reachable WHERE id = ? LIMIT 1
-        """, (depends_on_id, issue_id)).fetchone()
-        return row is not None
+        return self._query(_SQL_REACHES, (depends_on_id, issue_id)).fetchone() is not None
 
     # --- Labels ---
 
     def add_label(self, issue_id: str, label: str, actor: str) -> None:
         self._conn.execute(
-            "INSERT OR IGNORE INTO labels (issue_id, label) VALUES (?, ?)",
+            _SQL_INSERT_LABEL,
             (issue_id, label)
         )
-        self._record_event(issue_id, EventType.LABEL_ADDED, actor, new_value=label)
-        self.mark_dirty(issue_id)
-        self._conn.commit()
+        now_str = format_timestamp(now_utc())
+        self._record_event(issue_id, EventType.LABEL_ADDED, actor, new_value=label,
+                           created_at=now_str)
+        self._mark_dirty(issue_id, now_str)
+        self._forget_issues(issue_id)
+        self._commit()
 
     def remove_label(self, issue_id: str, label: str, actor: str) -> None:
         self._conn.execute(
             "DELETE FROM labels WHERE issue_id = ? AND label = ?",
             (issue_id, label)
         )
-        self._record_event(issue_id, EventType.LABEL_REMOVED, actor, old_value=label)
-        self.mark_dirty(issue_id)
-        self._conn.commit()
+        now_str = format_timestamp(now_utc())
+        self._record_event(issue_id, EventType.LABEL_REMOVED, actor, old_value=label,
+                           created_at=now_str)
+        self._mark_dirty(issue_id, now_str)
+        self._forget_issues(issue_id)
+        self._commit()
 
     def get_labels(self, issue_id: str) -> list[str]:
-        rows = self._conn.execute(
-            "SELECT label FROM labels WHERE issue_id = ? ORDER BY label",
-            (issue_id,)
-        ).fetchall()
-        return [row["label"] for row in rows]
+        with self._reader() as conn:
+            rows = self._query(
+                "SELECT label FROM labels WHERE issue_id = ? ORDER BY label",
+                (issue_id,), conn
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_labels_bulk(self, issue_ids: Iterable[str]) -> dict[str, list[str]]:
+        labels: defaultdict[str, list[str]] = defaultdict(list)
+        for issue_id, label in self._rows_for_issues(
+            "SELECT issue_id, label FROM labels WHERE issue_id IN ({ph}) ORDER BY label",
+            issue_ids,
+        ):
+            labels[issue_id].append(label)
+        return dict(labels)
 
     # --- Comments ---
 
     def add_comment(self, issue_id: str, author: str, text: str) -> int:
+        now_str = format_timestamp(now_utc())
         cur = self._conn.execute(
-            "INSERT INTO comments (issue_id, author, text, created_at) VALUES (?, ?, ?, ?)",
-            (issue_id, author, text, format_timestamp(now_utc()))
+            _SQL_INSERT_COMMENT,
+            (issue_id, author, text, now_str)
         )
-        self._record_event(issue_id, EventType.COMMENTED, author, new_value=text)
-        self.mark_dirty(issue_id)
-        self._conn.commit()
+        self._record_event(issue_id, EventType.COMMENTED, author, new_value=text,
+                           created_at=now_str)
+        self._mark_dirty(issue_id, now_str)
+        self._forget_issues(issue_id)
+        self._commit()
         return cur.lastrowid or 0
 
     def get_comments(self, issue_id: str) -> list[Comment]:
-        rows = self._conn.execute(
-            "SELECT * FROM comments WHERE issue_id = ? ORDER BY created_at ASC",
-            (issue_id,)
-        ).fetchall()
-        return [
-            Comment(
-                id=row["id"],
-                issue_id=row["issue_id"],
-                author=row["author"],
-                text=row["text"],
-                created_at=parse_timestamp(row["created_at"]) or now_utc(),
-            )
-            for row in rows
-        ]
+        return list(self.iter_comments(issue_id))
+
+    def iter_comments(self, issue_id: str) -> Iterator[Comment]:
+        with self._reader() as conn:
+            cur = self._query(_SQL_SELECT_COMMENTS.format(where="= ?"), (issue_id,), conn)
+            try:
+                while True:
+                    rows = cur.fetchmany(FETCH_BATCH)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield self._row_to_comment(row)
+            finally:
+                cur.close()
+
+    def get_comments_bulk(self, issue_ids: Iterable[str]) -> dict[str, list[Comment]]:
+        comments: defaultdict[str, list[Comment]] = defaultdict(list)
+        for row in self._rows_for_issues(
+            _SQL_SELECT_COMMENTS.format(where="IN ({ph})"), issue_ids
+        ):
+            comments[row[1]].append(self._row_to_comment(row))
+        return dict(comments)
 
     def import_comment(self, issue_id: str, author: str, text: str,
                        created_at: datetime) -> int:
         cur = self._conn.execute(
-            "INSERT INTO comments (issue_id, author, text, created_at) VALUES (?, ?, ?, ?)",
+            _SQL_INSERT_COMMENT,
             (issue_id, author, text, format_timestamp(created_at))
         )
-        self._conn.commit()
+        self._forget_issues(issue_id)
+        self._commit()
         return cur.lastrowid or 0
 
     # --- Events ---
 
     def get_events(self, issue_id: str) -> list[Event]:
-        rows = self._conn.execute(
-            "SELECT * FROM events WHERE issue_id = ? ORDER BY created_at ASC",
-            (issue_id,)
-        ).fetchall()
-        return [
-            Event(
-                id=row["id"],
-                issue_id=row["issue_id"],
-                event_type=row["event_type"],
-                actor=row["actor"],
-                old_value=row["old_value"],
-                new_value=row["new_value"],
-                comment=row["comment"],
-                created_at=parse_timestamp(row["created_at"]) or now_utc(),
-            )
-            for row in rows
-        ]
+        return list(self.iter_events(issue_id))
+
+    def iter_events(self, issue_id: str) -> Iterator[Event]:
+        with self._reader() as conn:
+            cur = self._query(_SQL_SELECT_EVENTS.format(where="= ?"), (issue_id,), conn)
+            try:
+                while True:
+                    rows = cur.fetchmany(FETCH_BATCH)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield self._row_to_event(row)
+            finally:
+                cur.close()
+
+    def get_events_bulk(self, issue_ids: Iterable[str]) -> dict[str, list[Event]]:
+        events: defaultdict[str, list[Event]] = defaultdict(list)
+        for row in self._rows_for_issues(
+            _SQL_SELECT_EVENTS.format(where="IN ({ph})"), issue_ids
+        ):
+            events[row[1]].append(self._row_to_event(row))
+        return dict(events)
+
+    @staticmethod
+    def _row_to_event(row: tuple) -> Event:
+        """Build an Event from a row in _SQL_SELECT_EVENTS column order."""
+        id_, issue_id, event_type, actor, old_value, new_value, comment, created_at = row
+        return Event(id_, issue_id, event_type, actor, old_value, new_value, comment,
+                     created_at or now_utc())
 
     # --- Dirty tracking ---
 
     def mark_dirty(self, issue_id: str) -> None:
+        self._mark_dirty(issue_id, format_timestamp(now_utc()))
+
+    def _mark_dirty(self, issue_id: str, marked_at: str | None) -> None:
         self._conn.execute(
-            "INSERT INTO dirty_issues (issue_id, marked_at) VALUES (?, ?) "
-            "ON CONFLICT (issue_id) DO UPDATE SET marked_at = excluded.marked_at",
-            (issue_id, format_timestamp(now_utc()))
+            _SQL_MARK_DIRTY,
+            (issue_id, marked_at)
+        )
+
+    def _mark_dirty_many(self, issue_ids: Iterable[str], marked_at: str) -> None:
+        self._conn.executemany(
+            _SQL_MARK_DIRTY,
+            [(issue_id, marked_at) for issue_id in issue_ids]
         )
 
     def get_dirty_issues(self) -> list[str]:
-        rows = self._conn.execute(
-            "SELECT issue_id FROM dirty_issues ORDER BY marked_at ASC"
-        ).fetchall()
-        return [row["issue_id"] for row in rows]
+        return list(self.iter_dirty_issues())
+
+    def is_dirty(self, issue_id: str) -> bool:
+        # Primary-key probe on dirty_issues, which only holds dirty rows
+        with self._reader() as conn:
+            return self._query(
+                "SELECT 1 FROM dirty_issues WHERE issue_id = ?", (issue_id,), conn
+            ).fetchone() is not None
+
+    def count_dirty_issues(self) -> int:
+        with self._reader() as conn:
+            return self._query("SELECT COUNT(*) FROM dirty_issues", conn=conn).fetchone()[0]
+
+    def iter_dirty_issues(self) -> Iterator[str]:
+        with self._reader() as conn:
+            cur = self._query("SELECT issue_id FROM dirty_issues ORDER BY marked_at ASC",
+                              conn=conn)
+            try:
+                while True:
+                    rows = cur.fetchmany(FETCH_BATCH)
+                    if not rows:
+                        break
+                    for (issue_id,) in rows:
+                        yield issue_id
+            finally:
+                cur.close()
 
     def clear_dirty(self, issue_ids: list[str]) -> None:
         if not issue_ids:
             return
-        for issue_id in issue_ids:
+        ids = list(issue_ids)
+        for start in range(0, len(ids), MAX_SQL_PARAMS):
+            chunk = ids[start:start + MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
             self._conn.execute(
-                "DELETE FROM dirty_issues WHERE issue_id = ?", (issue_id,)
+                f"DELETE FROM dirty_issues WHERE issue_id IN ({placeholders})", chunk
             )
-        self._conn.commit()
+        self._commit()
 
     # --- Export hashes ---
 
     def get_export_hash(self, issue_id: str) -> str | None:
-        row = self._conn.execute(
-            "SELECT content_hash FROM export_hashes WHERE issue_id = ?",
-            (issue_id,)
-        ).fetchone()
-        return row["content_hash"] if row else None
+        with self._reader() as conn:
+            row = self._query(
+                "SELECT content_hash FROM export_hashes WHERE issue_id = ?",
+                (issue_id,), conn
+            ).fetchone()
+        return row[0] if row else None
 
     def set_export_hash(self, issue_id: str, content_hash: str) -> None:
         self._conn.execute(
@@ -855,19 +1373,35 @@ class SQLiteStorage(Storage):
             "ON CONFLICT (issue_id) DO UPDATE SET content_hash = excluded.content_hash, exported_at = excluded.exported_at",
             (issue_id, content_hash, format_timestamp(now_utc()))
         )
-        self._conn.commit()
+        self._commit()
 
     def clear_all_export_hashes(self) -> None:
         self._conn.execute("DELETE FROM export_hashes")
-        self._conn.commit()
+        self._commit()
 
     # --- Config ---
 
+    def _config(self) -> dict[str, str]:
+        """Return the config table, reading it once and serving later calls from memory.
+
+        Config is a handful of rows written by ``bd init``/``bd config set``
+        and read on every create and import, so the whole table is cached.
+        Writes made through another connection are not seen until
+        :meth:`invalidate_config`.
+        """
+        config = self._config_cache
+        if config is None:
+            with self._reader() as conn:
+                config = dict(self._query("SELECT key, value FROM config", conn=conn))
+            self._config_cache = config
+        return config
+
+    def invalidate_config(self) -> None:
+        """Drop the cached config so the next read goes back to the database."""
+        self._config_cache = None
+
     def get_config(self, key: str) -> str | None:
-        row = self._conn.execute(
-            "SELECT value FROM config WHERE key = ?", (key,)
-        ).fetchone()
-        return row["value"] if row else None
+        return self._config().get(key)
 
     def set_config(self, key: str, value: str) -> None:
         self._conn.execute(
@@ -875,19 +1409,21 @@ class SQLiteStorage(Storage):
             "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
             (key, value)
         )
-        self._conn.commit()
+        self._commit()
+        if self._config_cache is not None:
+            self._config_cache[key] = value
 
     def list_config(self) -> dict[str, str]:
-        rows = self._conn.execute("SELECT key, value FROM config ORDER BY key").fetchall()
-        return {row["key"]: row["value"] for row in rows}
+        return dict(sorted(self._config().items()))
 
     # --- Metadata ---
 
     def get_metadata(self, key: str) -> str | None:
-        row = self._conn.execute(
-            "SELECT value FROM metadata WHERE key = ?", (key,)
-        ).fetchone()
-        return row["value"] if row else None
+        with self._reader() as conn:
+            row = self._query(
+                "SELECT value FROM metadata WHERE key = ?", (key,), conn
+            ).fetchone()
+        return row[0] if row else None
 
     def set_metadata(self, key: str, value: str) -> None:
         self._conn.execute(
@@ -895,107 +1431,175 @@ class SQLiteStorage(Storage):
             "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
             (key, value)
         )
-        self._conn.commit()
+        self._commit()
 
     # --- Statistics ---
 
     def get_statistics(self) -> Statistics:
         stats = Statistics()
 
-        # Count by status
-        rows = self._conn.execute(
-            "SELECT status, COUNT(*) as cnt FROM issues WHERE status != 'tombstone' GROUP BY status"
-        ).fetchall()
-        for row in rows:
-            status = row["status"]
-            cnt = row["cnt"]
-            if status == Status.OPEN:
-                stats.open_issues = cnt
-            elif status == Status.IN_PROGRESS:
-                stats.in_progress_issues = cnt
-            elif status == Status.CLOSED:
-                stats.closed_issues = cnt
-            elif status == Status.BLOCKED:
-                stats.blocked_issues = cnt
-            elif status == Status.DEFERRED:
-                stats.deferred_issues = cnt
-            elif status == Status.PINNED:
-                stats.pinned_issues = cnt
+        # One scan: the (status, type, priority) groups are few, so the
+        # per-status, per-type and per-priority totals are summed here
+        with self._reader() as conn:
+            rows = self._query(
+                "SELECT status, issue_type, priority, COUNT(*) FROM issues "
+                "GROUP BY status, issue_type, priority", conn=conn
+            ).fetchall()
+            # Ready issues (not blocked among open), counted without hydrating them
+            stats.ready_issues = self._query(
+                f"SELECT COUNT(*) FROM issues i WHERE {_SQL_READY_WHERE}",
+                (format_timestamp(now_utc()),), conn
+            ).fetchone()[0]
+        by_status: dict[str, int] = {}
+        by_type: dict[str, int] = {}
+        by_priority: dict[int, int] = {}
+        for status, issue_type, priority, cnt in rows:
+            by_status[status] = by_status.get(status, 0) + cnt
+            if status == Status.TOMBSTONE:
+                # Tombstones counted separately
+                continue
             stats.total_issues += cnt
-
-        # Tombstones counted separately
-        row = self._conn.execute(
-            "SELECT COUNT(*) as cnt FROM issues WHERE status = 'tombstone'"
-        ).fetchone()
-        stats.tombstone_issues = row["cnt"] if row else 0
-
-        # Ready issues (not blocked among open)
-        ready = self.get_ready_work()
-        stats.ready_issues = len(ready)
-
-        # By type
-        rows = self._conn.execute(
-            "SELECT issue_type, COUNT(*) as cnt FROM issues WHERE status != 'tombstone' GROUP BY issue_type"
-        ).fetchall()
-        stats.by_type = {row["issue_type"]: row["cnt"] for row in rows}
-
-        # By priority
-        rows = self._conn.execute(
-            "SELECT priority, COUNT(*) as cnt FROM issues WHERE status != 'tombstone' GROUP BY priority"
-        ).fetchall()
-        stats.by_priority = {row["priority"]: row["cnt"] for row in rows}
+            by_type[issue_type] = by_type.get(issue_type, 0) + cnt
+            by_priority[priority] = by_priority.get(priority, 0) + cnt
+        for status, cnt in by_status.items():
+            attr = _STATUS_STAT_FIELDS.get(status)
+            if attr is not None:  # other statuses only count toward the total
+                setattr(stats, attr, cnt)
+        # Same key order the per-column GROUP BY queries used to produce
+        stats.by_type = dict(sorted(by_type.items()))
+        stats.by_priority = dict(sorted(by_priority.items()))
 
         return stats
 
     # --- Child counters ---
 
     def next_child_number(self, parent_id: str) -> int:
-        row = self._conn.execute(
-            "SELECT last_child FROM child_counters WHERE parent_id = ?",
-            (parent_id,)
-        ).fetchone()
-        if row:
-            next_num = row["last_child"] + 1
-            self._conn.execute(
-                "UPDATE child_counters SET last_child = ? WHERE parent_id = ?",
-                (next_num, parent_id)
-            )
+        # One atomic statement, so concurrent creates never mint the same
+        # child number. Without RETURNING, the SELECT runs in the same write
+        # transaction as the upsert, before _commit() releases the lock
+        if _HAS_RETURNING:
+            (next_num,) = self._conn.execute(
+                _SQL_BUMP_CHILD_COUNTER + " RETURNING last_child", (parent_id,)
+            ).fetchone()
         else:
-            next_num = 1
-            self._conn.execute(
-                "INSERT INTO child_counters (parent_id, last_child) VALUES (?, ?)",
-                (parent_id, next_num)
-            )
-        self._conn.commit()
+            self._conn.execute(_SQL_BUMP_CHILD_COUNTER, (parent_id,))
+            (next_num,) = self._conn.execute(
+                "SELECT last_child FROM child_counters WHERE parent_id = ?",
+                (parent_id,)
+            ).fetchone()
+        self._commit()
         return next_num
 
     # --- Transactions ---
 
-    def run_in_transaction(self, fn: Any) -> None:
+    @contextmanager
+    def transaction(self, immediate: bool = True) -> Iterator[None]:
+        """Group writes into one transaction; nested calls become savepoints.
+
+        ``BEGIN IMMEDIATE`` takes the write lock up front, so a concurrent
+        writer waits out busy_timeout at BEGIN rather than hitting
+        "database is locked" when a read transaction upgrades at its first
+        write. Per-method commits are deferred until the outermost block
+        exits.
+        """
+        if self._tx_depth:
+            with self.savepoint(f"tx{self._tx_depth}"):
+                yield
+            return
+        if self._conn.in_transaction:
+            self._conn.commit()  # flush writes left pending outside a transaction
+        self._conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        self._tx_depth = 1
         try:
-            fn(self)
-            self._conn.commit()
-        except Exception:
+            yield
+        except BaseException:
+            self._tx_depth = 0
             self._conn.rollback()
+            self._forget_issues()
+            self._config_cache = None
             raise
+        self._tx_depth = 0
+        self._conn.commit()
+
+    @contextmanager
+    def savepoint(self, name: str) -> Iterator[None]:
+        """Run a block under SAVEPOINT ``name``, rolling back only that block on error."""
+        if not name.isidentifier():
+            raise ValueError(f"invalid savepoint name: {name!r}")
+        if not self._tx_depth:
+            with self.transaction():
+                with self.savepoint(name):
+                    yield
+            return
+        self._conn.execute(f"SAVEPOINT {name}")
+        self._tx_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._tx_depth -= 1
+            self._conn.execute(f"ROLLBACK TO {name}")
+            self._conn.execute(f"RELEASE {name}")
+            self._forget_issues()
+            self._config_cache = None
+            raise
+        self._tx_depth -= 1
+        self._conn.execute(f"RELEASE {name}")
+
+    def _commit(self) -> None:
+        """Commit unless an enclosing transaction() will commit for us."""
+        if not self._tx_depth:
+            self._conn.commit()
 
     # --- Partial ID resolution ---
 
     def resolve_id(self, partial: str) -> str | None:
-        """Resolve a partial ID to a full ID."""
-        # Try exact match first
-        row = self._conn.execute(
-            "SELECT id FROM issues WHERE id = ?", (partial,)
-        ).fetchone()
-        if row:
-            return row["id"]
+        """Resolve a partial ID to a full ID.
 
-        # Try prefix match
-        rows = self._conn.execute(
-            "SELECT id FROM issues WHERE id LIKE ?", (f"{partial}%",)
-        ).fetchall()
+        Prefixes match ASCII letters case-insensitively, so "BD-A1" finds
+        "bd-a1"; "_" and "%" only match themselves.
+        """
+        if not partial:
+            return None
+        # One range scan over idx_issues_lower_id answers both questions:
+        # [folded, upper) holds exactly the IDs starting with partial, ignoring
+        # ASCII case, and in key order exact matches come first. LIMIT 2 is
+        # enough to tell a unique match from an ambiguous one
+        folded = partial.translate(_ASCII_LOWER)
+        last = ord(folded[-1])
+        with self._reader() as conn:
+            if last < 0x10FFFF:
+                upper = folded[:-1] + chr(last + 1)
+                rows = self._query(
+                    "SELECT id FROM issues WHERE lower(id) >= ? AND lower(id) < ? "
+                    "ORDER BY lower(id) LIMIT 2",
+                    (folded, upper), conn
+                ).fetchall()
+            else:
+                # No code point sorts after U+10FFFF, so there is no upper
+                # bound; scan from folded and stop at the first non-match
+                rows = []
+                for row in self._query(
+                    "SELECT id, lower(id) FROM issues WHERE lower(id) >= ? "
+                    "ORDER BY lower(id)", (folded,), conn
+                ):
+                    if not row[1].startswith(folded) or len(rows) == 2:
+                        break
+                    rows.append(row)
+        if not rows:
+            return None
+        # The exact match is case-sensitive, as a plain id = ? lookup would be
+        if any(row[0] == partial for row in rows):
+            return partial
         if len(rows) == 1:
-            return rows[0]["id"]
+            return rows[0][0]
+        if rows[1][0].translate(_ASCII_LOWER) == folded:
+            # Several IDs differ from partial only in case; the exact one may
+            # sort past LIMIT 2 among them
+            with self._reader() as conn:
+                row = self._query(
+                    "SELECT id FROM issues WHERE id = ?", (partial,), conn
+                ).fetchone()
+            return row[0] if row else None
         return None
 
 
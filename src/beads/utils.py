@@ -3,27 +3,47 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
-from beads.models import Issue, Status
+from beads.models import Issue, Status, now_utc, parse_timestamp
 
 
-def resolve_partial_id(partial: str, all_ids: list[str]) -> str | None:
+def resolve_partial_id(
+    partial: str, all_ids: list[str], presorted: bool = False
+) -> str | None:
     """Resolve a partial ID to a full ID.
 
     Matches if the partial is a prefix of any ID. Returns None if zero or
-    multiple matches.
+    multiple matches. An exact match wins over longer IDs sharing the prefix.
+
+    Prefer ``Storage.resolve_id``, which does this against the primary-key
+    index. Unsorted input is scanned once, which is cheaper than sorting it
+    for a single lookup. For repeated in-memory lookups, sort the IDs once and
+    pass ``presorted=True``; each lookup is then a binary search.
     """
-    matches = [id for id in all_ids if id.startswith(partial)]
-    if len(matches) == 1:
-        return matches[0]
-    # Try exact match first
-    if partial in all_ids:
+    if not presorted:
+        match, count = None, 0
+        for id in all_ids:
+            if id == partial:
+                return partial
+            if id.startswith(partial):
+                match, count = id, count + 1
+        return match if count == 1 else None
+    # Every ID starting with partial sorts at or after it, contiguously
+    i = bisect_left(all_ids, partial)
+    if i == len(all_ids) or not all_ids[i].startswith(partial):
+        return None
+    if all_ids[i] == partial:
         return partial
-    return None
+    if i + 1 < len(all_ids) and all_ids[i + 1].startswith(partial):
+        return None
+    return all_ids[i]
 
 
+@lru_cache(maxsize=4096)
 def extract_issue_prefix(issue_id: str) -> str:
     """Extract the prefix from an issue ID.
 
@@ -33,16 +53,19 @@ def extract_issue_prefix(issue_id: str) -> str:
         "bd-a3f2dd.1" → "bd"
     """
     # Remove hierarchical suffix first (everything after first .)
-    base = issue_id.split(".")[0]
-    # Find last hyphen in the base
-    last_hyphen = base.rfind("-")
-    if last_hyphen < 0:
-        return base
-    return base[:last_hyphen]
+    base = issue_id.partition(".")[0]
+    # Everything before the last hyphen in the base
+    prefix, hyphen, _ = base.rpartition("-")
+    return prefix if hyphen else base
+
+
+_PRIORITY_TEXT = ("P0", "P1", "P2", "P3", "P4")
 
 
 def format_priority(priority: int) -> str:
     """Format priority as P0-P4."""
+    if 0 <= priority < len(_PRIORITY_TEXT):
+        return _PRIORITY_TEXT[priority]
     return f"P{priority}"
 
 
@@ -81,63 +104,48 @@ def status_symbol(status: str) -> str:
     return symbols.get(status, "?")
 
 
-def format_time_ago(dt: datetime) -> str:
-    """Format a datetime as a relative time string."""
-    now = datetime.now(timezone.utc)
+# (upper bound in seconds, unit suffix, seconds per unit), ascending.
+# Months are 30 days and stop at 12 of them; years are 365 days.
+_TIME_AGO_STEPS = (
+    (60, "", 1),
+    (3600, "m", 60),
+    (86400, "h", 3600),
+    (30 * 86400, "d", 86400),
+    (360 * 86400, "mo", 30 * 86400),
+    (float("inf"), "y", 365 * 86400),
+)
+
+
+def format_time_ago(dt: datetime, now: datetime | None = None) -> str:
+    """Format a datetime as a relative time string.
+
+    Pass ``now`` to format many timestamps against one clock reading.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
-    delta = now - dt
-    seconds = int(delta.total_seconds())
-    if seconds < 60:
+    seconds = int((now - dt).total_seconds())
+    for limit, unit, size in _TIME_AGO_STEPS:
+        if seconds < limit:
+            break
+    if not unit:
         return "just now"
-    minutes = seconds // 60
-    if minutes < 60:
-        return f"{minutes}m ago"
-    hours = minutes // 60
-    if hours < 24:
-        return f"{hours}h ago"
-    days = hours // 24
-    if days < 30:
-        return f"{days}d ago"
-    months = days // 30
-    if months < 12:
-        return f"{months}mo ago"
-    years = days // 365
-    return f"{years}y ago"
+    return f"{seconds // size}{unit} ago"
+
+
+_DURATION_RE = re.compile(r"(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m(?!s))?(?:(\d+)s)?(?:(\d+)ms)?")
 
 
 def parse_duration(s: str) -> timedelta | None:
     """Parse a Go-style duration string (e.g., '5s', '1h30m', '2d')."""
     if not s:
         return None
-    total_seconds = 0.0
-    remaining = s.strip()
-
-    # Support day suffix
-    m = re.match(r"(\d+)d", remaining)
-    if m:
-        total_seconds += int(m.group(1)) * 86400
-        remaining = remaining[m.end():]
-
-    m = re.match(r"(\d+)h", remaining)
-    if m:
-        total_seconds += int(m.group(1)) * 3600
-        remaining = remaining[m.end():]
-
-    m = re.match(r"(\d+)m(?!s)", remaining)
-    if m:
-        total_seconds += int(m.group(1)) * 60
-        remaining = remaining[m.end():]
-
-    m = re.match(r"(\d+)s", remaining)
-    if m:
-        total_seconds += int(m.group(1))
-        remaining = remaining[m.end():]
-
-    m = re.match(r"(\d+)ms", remaining)
-    if m:
-        total_seconds += int(m.group(1)) / 1000
-        remaining = remaining[m.end():]
+    # One anchored pass over the d, h, m, s, ms components, each optional
+    # but in that order; the lookahead keeps "5ms" from matching as minutes
+    m = _DURATION_RE.match(s.strip())
+    days, hours, minutes, seconds, millis = (int(g) if g else 0 for g in m.groups())
+    total_seconds = days * 86400 + hours * 3600 + minutes * 60 + seconds + millis / 1000
 
     if total_seconds == 0 and s:
         return None
@@ -151,15 +159,55 @@ def truncate(s: str, max_len: int = 60) -> str:
     return s[:max_len - 3] + "..."
 
 
-def format_issue_row(issue: Issue, long_format: bool = False) -> str:
+# Fields an issue_row_formatter row function takes, in order; pass to
+# Storage.list_issues_projected to list issues without building Issue objects.
+ISSUE_ROW_FIELDS = ("id", "status", "priority", "title", "created_at", "issue_type", "assignee")
+
+
+def issue_row_values(issue: Issue) -> tuple[Any, ...]:
+    """Return an issue's ISSUE_ROW_FIELDS values, as a projected query would."""
+    return (issue.id, issue.status, issue.priority, issue.title, issue.created_at,
+            issue.issue_type, issue.assignee)
+
+
+def _row_parts(status: str, priority: int | None, title: str,
+               created_at: datetime | str | None,
+               now: datetime | None) -> tuple[str, str, str, str]:
+    """Symbol, priority, truncated title and age shared by both row layouts."""
+    if not isinstance(created_at, datetime):
+        created_at = parse_timestamp(created_at) or now_utc()
+    return (status_symbol(status), format_priority(2 if priority is None else priority),
+            truncate(title or "", 50), format_time_ago(created_at, now))
+
+
+def _fmt_short(issue_id: str, status: str, priority: int | None, title: str,
+               created_at: datetime | str | None, issue_type: str | None = "",
+               assignee: str | None = "", now: datetime | None = None) -> str:
+    sym, pri, title, age = _row_parts(status, priority, title, created_at, now)
+    return f"[{sym}] {issue_id:<20} {pri} {title}  ({age})"
+
+
+def _fmt_long(issue_id: str, status: str, priority: int | None, title: str,
+              created_at: datetime | str | None, issue_type: str | None = "",
+              assignee: str | None = "", now: datetime | None = None) -> str:
+    sym, pri, title, age = _row_parts(status, priority, title, created_at, now)
+    assignee = assignee or "-"
+    itype = issue_type or "task"
+    return f"[{sym}] {issue_id:<20} {pri} {itype:<8} {assignee:<15} {title}  ({age})"
+
+
+def issue_row_formatter(long_format: bool = False) -> Callable[..., str]:
+    """Pick the row formatter for a whole listing.
+
+    The returned function takes ISSUE_ROW_FIELDS values and an optional
+    ``now``, and accepts values straight from a projected query: stored
+    timestamp text and NULL columns are handled. List commands choose
+    the layout once rather than per row.
+    """
+    return _fmt_long if long_format else _fmt_short
+
+
+def format_issue_row(issue: Issue, long_format: bool = False,
+                     now: datetime | None = None) -> str:
     """Format an issue as a single-line row for list display."""
-    sym = status_symbol(issue.status)
-    pri = format_priority(issue.priority)
-    age = format_time_ago(issue.created_at)
-    title = truncate(issue.title, 50)
-
-    if long_format:
-        assignee = issue.assignee or "-"
-        itype = issue.issue_type or "task"
-        return f"[{sym}] {issue.id:<20} {pri} {itype:<8} {assignee:<15} {title}  ({age})"
-    return f"[{sym}] {issue.id:<20} {pri} {title}  ({age})"
+    return issue_row_formatter(long_format)(*issue_row_values(issue), now=now)
@@ -0,0 +1,22 @@
+"""Shared fixtures."""
+
+import pytest
+
+from beads.storage.sqlite_store import SQLiteStorage
+
+
+@pytest.fixture(scope="session")
+def _template_store():
+    """An initialized in-memory database for per-test stores to copy."""
+    s = SQLiteStorage(":memory:")
+    yield s
+    s.close()
+
+
+@pytest.fixture
+def store(_template_store: SQLiteStorage):
+    """Create an in-memory storage for testing, cloned from the template."""
+    s = SQLiteStorage._clone_from(_template_store)
+    s.set_config("issue_prefix", "test")
+    yield s
+    s.close()
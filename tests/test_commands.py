@@ -63,6 +63,14 @@ class TestCreate:
         parts = result.output.strip().split()
         issue_id = parts[2].rstrip(":")
 
+    def test_create_with_unknown_dep_writes_nothing(self, runner: CliRunner, beads_dir: str):
+        result = runner.invoke(cli, [
+            "create", "--title", "Orphan", "--deps", "test-missing"
+        ])
+        assert result.exit_code == 1
+        assert "issue not found" in result.output
+        assert "No issues found" in runner.invoke(cli, ["list"]).output
+
 
 class TestList:
     def test_list_empty(self, runner: CliRunner, beads_dir: str):
@@ -77,6 +85,28 @@ class TestList:
         assert result.exit_code == 0
         assert "2 issue(s)" in result.output
 
+    def test_list_long_and_search(self, runner: CliRunner, beads_dir: str):
+        runner.invoke(cli, ["create", "--title", "Findable thing"])
+        result = runner.invoke(cli, ["list", "--long"])
+        assert result.exit_code == 0
+        assert "Findable thing" in result.output
+        assert "task" in result.output
+        result = runner.invoke(cli, ["search", "Findable"])
+        assert result.exit_code == 0
+        assert "1 result(s)" in result.output
+
+
+class TestComments:
+    def test_add_and_list(self, runner: CliRunner, beads_dir: str):
+        result = runner.invoke(cli, ["create", "--title", "Talky", "--silent"])
+        issue_id = result.output.strip()
+        result = runner.invoke(cli, ["comments", issue_id])
+        assert "No comments on" in result.output
+        runner.invoke(cli, ["comment", "add", issue_id, "first note"])
+        result = runner.invoke(cli, ["comments", issue_id])
+        assert result.exit_code == 0
+        assert "first note" in result.output
+
 
 class TestClose:
     def test_close(self, runner: CliRunner, beads_dir: str):
@@ -1,8 +1,6 @@
 """Tests for JSONL export and import."""
 
 import json
-import os
-import tempfile
 
 import pytest
 
@@ -13,29 +11,15 @@ from beads.storage.sqlite_store import SQLiteStorage
 
 
 @pytest.fixture
-def store():
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    s = SQLiteStorage(path)
-    s.set_config("issue_prefix", "test")
-    yield s
-    s.close()
-    os.unlink(path)
-
-
-@pytest.fixture
-def jsonl_path():
-    fd, path = tempfile.mkstemp(suffix=".jsonl")
-    os.close(fd)
-    yield path
-    if os.path.exists(path):
-        os.unlink(path)
+def jsonl_path(tmp_path):
+    return str(tmp_path / "issues.jsonl")
 
 
 def _make_issue(id: str, title: str = "Test", **kwargs) -> Issue:
+    now = now_utc()
     return Issue(
         id=id, title=title, status=Status.OPEN, priority=2,
-        issue_type="task", created_at=now_utc(), updated_at=now_utc(),
+        issue_type="task", created_at=now, updated_at=now,
         **kwargs,
     )
 
@@ -131,16 +115,32 @@ class TestImport:
         assert result2.created == 0
         assert result2.unchanged == 1
 
-    def test_roundtrip(self, store: SQLiteStorage, jsonl_path: str):
+    def test_import_keeps_forward_dependencies(self, store: SQLiteStorage, jsonl_path: str):
+        """A dependency on an issue later in the same file survives import."""
+        base = {"status": "open", "priority": 2, "issue_type": "task",
+                "created_at": "2026-01-15T10:00:00Z", "updated_at": "2026-01-15T10:00:00Z"}
+        blocked = dict(base, id="test-a", title="Blocked", dependencies=[{
+            "issue_id": "test-a", "depends_on_id": "test-b", "type": "blocks",
+            "created_at": "2026-01-15T10:00:00Z",
+        }])
+        blocker = dict(base, id="test-b", title="Blocker")
+        with open(jsonl_path, "w") as f:
+            f.write(json.dumps(blocked) + "\n")
+            f.write(json.dumps(blocker) + "\n")
+
+        result = import_jsonl(store, jsonl_path)
+        assert result.created == 2
+        deps = store.get_dependency_records("test-a")
+        assert [d.depends_on_id for d in deps] == ["test-b"]
+
+    def test_roundtrip(self, store: SQLiteStorage, jsonl_path: str, tmp_path):
         """Create in Python, export, import into fresh DB - should match."""
         store.create_issue(_make_issue("test-rt", "Roundtrip", description="Test roundtrip"), "alice")
         store.add_label("test-rt", "important", "alice")
         flush_to_jsonl(store, jsonl_path)
 
         # Import into a fresh store
-        fd, path2 = tempfile.mkstemp(suffix=".db")
-        os.close(fd)
-        store2 = SQLiteStorage(path2)
+        store2 = SQLiteStorage(str(tmp_path / "fresh.db"), synchronous="OFF")
         store2.set_config("issue_prefix", "test")
         result = import_jsonl(store2, jsonl_path)
         assert result.created == 1
@@ -151,7 +151,6 @@ class TestImport:
         assert got.description == "Test roundtrip"
 
         store2.close()
-        os.unlink(path2)
 
 
 class TestParseJSONL:
@@ -1,8 +1,12 @@
 """Tests for data models."""
 
 import json
+from dataclasses import fields
 from datetime import datetime, timezone
 
+import pytest
+
+from beads import jsonutil
 from beads.models import (
     Comment, Dependency, DepType, Issue, IssueType, Status,
     format_timestamp, parse_timestamp,
@@ -92,6 +96,33 @@ def test_issue_roundtrip():
     assert restored.labels == issue.labels
 
 
+@pytest.mark.parametrize("codec", ["orjson", "stdlib"])
+def test_json_codec_matches_stdlib(codec):
+    """Shared codec output must not depend on whether orjson is installed."""
+    if codec == "orjson":
+        pytest.importorskip("orjson")
+        encode, decode = jsonutil.dumps, jsonutil.loads
+    else:
+        encode, decode = jsonutil._stdlib_dumps, json.loads
+    issue = Issue(id="t-1", title="Ünïcode \"quoted\"", priority=0,
+                  metadata='{"big": 18446744073709551616}')
+    d = issue.to_dict()
+    assert encode(d) == json.dumps(d, ensure_ascii=False, separators=(",", ":"))
+    assert decode(encode(d)) == d
+    with pytest.raises(TypeError):
+        encode({"when": datetime(2025, 1, 1, tzinfo=timezone.utc)})
+
+
+def test_from_dict_fills_every_field():
+    """from_dict skips __init__, so it must still set each field, with fresh lists."""
+    a, b = Issue.from_dict({}), Issue.from_dict({})
+    assert set(a.__dict__) >= {f.name for f in fields(Issue)}
+    assert a.title == "" and a.status == Status.OPEN and a.external_ref is None
+    a.labels.append("x")
+    a.waiters.append("w")
+    assert b.labels == [] and b.waiters == []
+
+
 def test_content_hash_deterministic():
     """Content hash should be deterministic for same content."""
     issue1 = Issue(title="Test", description="Desc", status=Status.OPEN, priority=2)
@@ -105,6 +136,16 @@ def test_content_hash_changes_with_content():
     assert issue1.compute_content_hash() != issue2.compute_content_hash()
 
 
+def test_content_hash_pinned():
+    """Hash bytes must not drift: JSONL content hashes are compared with Go's."""
+    issue = Issue(id="b", title="Fix login", description="Steps", priority=1,
+                  external_ref="gh-1", pinned=True, waiters=["w1", "w2"],
+                  quality_score=0.25)
+    assert issue.compute_content_hash() == (
+        "d54c3e6d5a0787aaa78b8a6206aa6c569ae5d1fce7049312b23ca952ec059a25"
+    )
+
+
 def test_priority_zero_serialized():
     """Priority 0 (P0/critical) must be serialized even though it's zero."""
     issue = Issue(id="t", title="t", priority=0)
@@ -124,6 +165,21 @@ def test_timestamp_roundtrip():
     assert formatted == ts
 
 
+def test_issue_timestamp_parsed_lazily():
+    issue = Issue(id="bd-1", title="Test")
+    issue.closed_at = "2026-01-15T10:00:00Z"
+    assert issue.closed_at == datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+    issue.closed_at = None
+    assert issue.closed_at is None
+
+
+def test_comment_timestamp_parsed_lazily():
+    comment = Comment(1, "bd-1", "alice", "hi", "2026-01-15T10:00:00Z")
+    assert comment.__dict__["created_at"] == "2026-01-15T10:00:00Z"
+    assert comment.to_dict()["created_at"] == "2026-01-15T10:00:00Z"
+    assert comment.created_at == datetime(2026, 1, 15, 10, 0, tzinfo=timezone.utc)
+
+
 def test_dependency_to_dict():
     dep = Dependency(
         issue_id="test-1",
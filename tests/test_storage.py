@@ -1,32 +1,34 @@
 """Tests for SQLite storage."""
 
-import os
-import tempfile
+from datetime import datetime, timezone
 
 import pytest
 
 from beads.models import (
-    Dependency, DepType, Issue, IssueFilter, Status, now_utc,
+    Dependency, DepType, Issue, IssueFilter, Status,
 )
+from beads.storage import sqlite_store
 from beads.storage.sqlite_store import SQLiteStorage
 
 
 @pytest.fixture
-def store():
-    """Create a temporary storage for testing."""
-    fd, path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-    s = SQLiteStorage(path)
+def file_store(tmp_path):
+    """Create a file-backed storage, for tests that reopen it or use the reader pool."""
+    # WAL comes with any file database; skipping fsync is safe for throwaway files
+    s = SQLiteStorage(str(tmp_path / "t.db"), synchronous="OFF")
     s.set_config("issue_prefix", "test")
     yield s
     s.close()
-    os.unlink(path)
+
+
+# Fixed creation time for test issues, so their content hashes are stable
+FROZEN_NOW = datetime(2026, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
 
 
 def _make_issue(id: str, title: str = "Test", **kwargs) -> Issue:
     defaults = dict(
         id=id, title=title, status=Status.OPEN, priority=2,
-        issue_type="task", created_at=now_utc(), updated_at=now_utc(),
+        issue_type="task", created_at=FROZEN_NOW, updated_at=FROZEN_NOW,
     )
     defaults.update(kwargs)
     return Issue(**defaults)
@@ -70,17 +72,73 @@ class TestIssueCRUD:
         assert got.status == Status.OPEN
         assert got.closed_at is None
 
+    def test_get_issue_cache_returns_fresh_copies(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-1", "Cached"), "alice")
+        first = store.get_issue("test-1")
+        first.title = "mutated"
+        first.labels.append("mutated")
+        second = store.get_issue("test-1")
+        assert second.title == "Cached"
+        assert second.labels == []
+        store.add_label("test-1", "bug", "alice")
+        assert store.get_issue("test-1").labels == ["bug"]
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.update_issue("test-1", {"title": "Rolled back"}, "alice")
+                assert store.get_issue("test-1").title == "Rolled back"
+                raise RuntimeError("boom")
+        assert store.get_issue("test-1").title == "Cached"
+
+    def test_get_issue_cache_copies_children(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-1", "Parent"), "alice")
+        store.create_issue(_make_issue("test-2", "Child"), "alice")
+        store.add_dependency(Dependency(
+            issue_id="test-2", depends_on_id="test-1",
+            type=DepType.BLOCKS, created_by="alice",
+        ), "alice")
+        first = store.get_issue("test-2")
+        first.dependencies[0].depends_on_id = "test-999"
+        assert store.get_issue("test-2").dependencies[0].depends_on_id == "test-1"
+
+    def test_list_projected(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-1", "First", priority=1), "alice")
+        store.create_issue(_make_issue("test-2", "Second", priority=0), "alice")
+        rows = store.list_issues_projected(
+            ("id", "title", "priority"), IssueFilter(), sort_by="priority",
+        )
+        assert rows == [("test-2", "Second", 0), ("test-1", "First", 1)]
+        with pytest.raises(ValueError, match="Unknown issue field"):
+            store.list_issues_projected(("id; DROP TABLE issues",), IssueFilter())
+
+    def test_search_projected_matches_search(self, store: SQLiteStorage):
+        store.create_issues_bulk([
+            _make_issue("test-1", "Fix login"), _make_issue("test-2", "Add logout"),
+            _make_issue("test-3", "Fix login page"),
+        ], "alice")
+        full = [i.id for i in store.search_issues("login", IssueFilter())]
+        rows = store.search_issues_projected(("id",), "login", IssueFilter())
+        assert [r[0] for r in rows] == full
+        assert sorted(full) == ["test-1", "test-3"]
+
     def test_delete(self, store: SQLiteStorage):
         issue = _make_issue("test-1")
         store.create_issue(issue, "alice")
         store.delete_issue("test-1")
         assert store.get_issue("test-1") is None
 
+    @pytest.mark.parametrize("returning", [True, False])
+    def test_next_child_number(self, store: SQLiteStorage, monkeypatch, returning):
+        monkeypatch.setattr(sqlite_store, "_HAS_RETURNING", returning)
+        store.create_issue(_make_issue("test-1"), "alice")
+        assert [store.next_child_number("test-1") for _ in range(3)] == [1, 2, 3]
+
 
 class TestDependencies:
     def test_add_and_get(self, store: SQLiteStorage):
-        store.create_issue(_make_issue("test-1", "Blocker"), "alice")
-        store.create_issue(_make_issue("test-2", "Blocked"), "alice")
+        store.create_issues_bulk([
+            _make_issue("test-1", "Blocker"),
+            _make_issue("test-2", "Blocked"),
+        ], "alice")
         dep = Dependency(
             issue_id="test-2", depends_on_id="test-1",
             type=DepType.BLOCKS, created_by="alice",
@@ -91,8 +149,10 @@ class TestDependencies:
         assert deps[0].id == "test-1"
 
     def test_cycle_detection(self, store: SQLiteStorage):
-        store.create_issue(_make_issue("test-1"), "alice")
-        store.create_issue(_make_issue("test-2"), "alice")
+        store.create_issues_bulk([
+            _make_issue("test-1"),
+            _make_issue("test-2"),
+        ], "alice")
         dep1 = Dependency(issue_id="test-2", depends_on_id="test-1",
                           type=DepType.BLOCKS, created_by="alice")
         store.add_dependency(dep1, "alice")
@@ -102,6 +162,37 @@ class TestDependencies:
         with pytest.raises(ValueError, match="cycle"):
             store.add_dependency(dep2, "alice")
 
+    def test_cycle_detection_deep_chain(self, store: SQLiteStorage):
+        n = 150
+        store.create_issues_bulk([_make_issue(f"test-{i}") for i in range(n)], "alice")
+        with store.transaction():
+            for i in range(1, n):
+                store.add_dependency(Dependency(
+                    issue_id=f"test-{i}", depends_on_id=f"test-{i - 1}",
+                    type=DepType.BLOCKS, created_by="alice",
+                ), "alice")
+        with pytest.raises(ValueError, match="cycle"):
+            store.add_dependency(Dependency(
+                issue_id="test-0", depends_on_id=f"test-{n - 1}",
+                type=DepType.BLOCKS, created_by="alice",
+            ), "alice")
+
+    def test_cycle_detection_sees_other_connections(self, file_store: SQLiteStorage):
+        file_store.create_issues_bulk([
+            _make_issue("test-1"),
+            _make_issue("test-2"),
+        ], "alice")
+        assert not file_store.has_cycle("test-1", "test-2")
+        other = SQLiteStorage(file_store.path())
+        try:
+            other.add_dependency(Dependency(
+                issue_id="test-2", depends_on_id="test-1",
+                type=DepType.BLOCKS, created_by="bob",
+            ), "bob")
+        finally:
+            other.close()
+        assert file_store.has_cycle("test-1", "test-2")
+
     def test_self_cycle(self, store: SQLiteStorage):
         store.create_issue(_make_issue("test-1"), "alice")
         dep = Dependency(issue_id="test-1", depends_on_id="test-1",
@@ -110,14 +201,29 @@ class TestDependencies:
             store.add_dependency(dep, "alice")
 
     def test_remove(self, store: SQLiteStorage):
-        store.create_issue(_make_issue("test-1"), "alice")
-        store.create_issue(_make_issue("test-2"), "alice")
+        store.create_issues_bulk([
+            _make_issue("test-1"),
+            _make_issue("test-2"),
+        ], "alice")
         dep = Dependency(issue_id="test-2", depends_on_id="test-1",
                          type=DepType.BLOCKS, created_by="alice")
         store.add_dependency(dep, "alice")
         store.remove_dependency("test-2", "test-1", "alice")
         assert len(store.get_dependencies("test-2")) == 0
 
+    def test_create_skips_missing_targets(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-1"), "alice")
+        issue = _make_issue("test-2")
+        issue.dependencies = [
+            Dependency(issue_id="test-2", depends_on_id="test-1",
+                       type=DepType.BLOCKS, created_by="alice"),
+            Dependency(issue_id="test-2", depends_on_id="test-missing",
+                       type=DepType.BLOCKS, created_by="alice"),
+        ]
+        store.create_issue(issue, "alice")
+        records = store.get_dependency_records("test-2")
+        assert [d.depends_on_id for d in records] == ["test-1"]
+
 
 class TestReadyWork:
     def test_unblocked_is_ready(self, store: SQLiteStorage):
@@ -127,41 +233,64 @@ class TestReadyWork:
         assert ready[0].id == "test-1"
 
     def test_blocked_not_ready(self, store: SQLiteStorage):
-        store.create_issue(_make_issue("test-1"), "alice")
-        store.create_issue(_make_issue("test-2"), "alice")
-        dep = Dependency(issue_id="test-2", depends_on_id="test-1",
-                         type=DepType.BLOCKS, created_by="alice")
-        store.add_dependency(dep, "alice")
+        with store.transaction():
+            store.create_issues_bulk([
+                _make_issue("test-1"),
+                _make_issue("test-2"),
+            ], "alice")
+            dep = Dependency(issue_id="test-2", depends_on_id="test-1",
+                             type=DepType.BLOCKS, created_by="alice")
+            store.add_dependency(dep, "alice")
         ready = store.get_ready_work()
         assert len(ready) == 1
         assert ready[0].id == "test-1"
 
     def test_unblocked_after_close(self, store: SQLiteStorage):
-        store.create_issue(_make_issue("test-1"), "alice")
-        store.create_issue(_make_issue("test-2"), "alice")
-        dep = Dependency(issue_id="test-2", depends_on_id="test-1",
-                         type=DepType.BLOCKS, created_by="alice")
-        store.add_dependency(dep, "alice")
-        store.close_issue("test-1", "done", "alice")
+        with store.transaction():
+            store.create_issues_bulk([
+                _make_issue("test-1"),
+                _make_issue("test-2"),
+            ], "alice")
+            dep = Dependency(issue_id="test-2", depends_on_id="test-1",
+                             type=DepType.BLOCKS, created_by="alice")
+            store.add_dependency(dep, "alice")
+            store.close_issue("test-1", "done", "alice")
         ready = store.get_ready_work()
         assert len(ready) == 1
         assert ready[0].id == "test-2"
 
     def test_closed_not_ready(self, store: SQLiteStorage):
-        issue = _make_issue("test-1")
-        store.create_issue(issue, "alice")
-        store.close_issue("test-1", "done", "alice")
+        with store.transaction():
+            issue = _make_issue("test-1")
+            store.create_issue(issue, "alice")
+            store.close_issue("test-1", "done", "alice")
         ready = store.get_ready_work()
         assert len(ready) == 0
 
+    def test_one_open_blocker_still_blocks(self, store: SQLiteStorage):
+        with store.transaction():
+            store.create_issues_bulk([
+                _make_issue("test-1"),
+                _make_issue("test-2"),
+                _make_issue("test-3"),
+            ], "alice")
+            for blocker in ("test-1", "test-2"):
+                store.add_dependency(Dependency(
+                    issue_id="test-3", depends_on_id=blocker,
+                    type=DepType.BLOCKS, created_by="alice",
+                ), "alice")
+            store.close_issue("test-1", "done", "alice")
+        ready = store.get_ready_work()
+        assert [i.id for i in ready] == ["test-2"]
+
 
 class TestLabels:
     def test_add_and_get(self, store: SQLiteStorage):
         store.create_issue(_make_issue("test-1"), "alice")
         store.add_label("test-1", "urgent", "alice")
         store.add_label("test-1", "backend", "alice")
-        labels = store.get_labels("test-1")
-        assert sorted(labels) == ["backend", "urgent"]
+        # Labels come back sorted, whatever order they were added in
+        assert store.get_labels("test-1") == ["backend", "urgent"]
 
     def test_remove(self, store: SQLiteStorage):
         store.create_issue(_make_issue("test-1"), "alice")
@@ -169,6 +298,16 @@ class TestLabels:
         store.remove_label("test-1", "urgent", "alice")
         assert store.get_labels("test-1") == []
 
+    def test_list_loads_children(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-1"), "alice")
+        store.create_issue(_make_issue("test-2"), "alice")
+        store.add_label("test-1", "urgent", "alice")
+        store.add_comment("test-2", "alice", "Hello world")
+        by_id = {i.id: i for i in store.list_issues(IssueFilter())}
+        assert by_id["test-1"].labels == ["urgent"]
+        assert by_id["test-2"].labels == []
+        assert [c.text for c in by_id["test-2"].comments] == ["Hello world"]
+
 
 class TestComments:
     def test_add_and_get(self, store: SQLiteStorage):
@@ -179,12 +318,35 @@ class TestComments:
         assert comments[0].text == "Hello world"
         assert comments[0].author == "alice"
 
+    def test_bulk_getters(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-1"), "alice")
+        store.create_issue(_make_issue("test-2"), "alice")
+        store.add_comment("test-1", "alice", "first")
+        store.add_label("test-2", "b", "alice")
+        store.add_label("test-2", "a", "alice")
+        ids = ["test-1", "test-2", "test-missing"]
+        assert store.get_labels_bulk(ids) == {"test-2": ["a", "b"]}
+        comments = store.get_comments_bulk(ids)
+        assert [c.text for c in comments["test-1"]] == ["first"]
+        assert "test-2" not in comments
+        events = store.get_events_bulk(ids)
+        assert [e.event_type for e in events["test-2"]] == [
+            e.event_type for e in store.get_events("test-2")
+        ]
+
 
 class TestPartialIDResolution:
     def test_exact_match(self, store: SQLiteStorage):
         store.create_issue(_make_issue("test-abc123"), "alice")
         assert store.resolve_id("test-abc123") == "test-abc123"
 
+    def test_exact_match_beats_longer_ids(self, store: SQLiteStorage):
+        store.create_issues_bulk([
+            _make_issue("test-abc"),
+            _make_issue("test-abc.1"),
+        ], "alice")
+        assert store.resolve_id("test-abc") == "test-abc"
+
     def test_prefix_match(self, store: SQLiteStorage):
         store.create_issue(_make_issue("test-abc123"), "alice")
         assert store.resolve_id("test-abc") == "test-abc123"
@@ -197,25 +359,120 @@ class TestPartialIDResolution:
     def test_not_found(self, store: SQLiteStorage):
         assert store.resolve_id("nonexistent") is None
 
+    def test_prefix_is_literal(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-abc123"), "alice")
+        assert store.resolve_id("test_abc") is None
+        assert store.resolve_id("test-%") is None
+
+    def test_prefix_ignores_ascii_case(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-abc123"), "alice")
+        assert store.resolve_id("TEST-ABC") == "test-abc123"
+        assert store.resolve_id("test-abc") == "test-abc123"
+
+    def test_exact_match_is_case_sensitive(self, store: SQLiteStorage):
+        store.create_issues_bulk([
+            _make_issue("test-ab"), _make_issue("test-AB"), _make_issue("test-Ab"),
+        ], "alice")
+        assert store.resolve_id("test-ab") == "test-ab"
+        assert store.resolve_id("test-AB") == "test-AB"
+        assert store.resolve_id("test-Ab") == "test-Ab"
+        assert store.resolve_id("TEST-AB") is None
+
+    def test_prefix_ending_in_max_code_point(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-\U0010ffffa"), "alice")
+        assert store.resolve_id("test-\U0010ffff") == "test-\U0010ffffa"
+
 
 class TestDirtyTracking:
     def test_create_marks_dirty(self, store: SQLiteStorage):
         store.create_issue(_make_issue("test-1"), "alice")
-        dirty = store.get_dirty_issues()
-        assert "test-1" in dirty
+        assert store.is_dirty("test-1")
+        assert store.count_dirty_issues() == 1
 
     def test_clear_dirty(self, store: SQLiteStorage):
         store.create_issue(_make_issue("test-1"), "alice")
         store.clear_dirty(["test-1"])
+        assert not store.is_dirty("test-1")
         assert store.get_dirty_issues() == []
 
+    def test_iter_dirty_stops_early(self, store: SQLiteStorage):
+        store.create_issue(_make_issue("test-1"), "alice")
+        store.create_issue(_make_issue("test-2"), "alice")
+        assert next(store.iter_dirty_issues()) == "test-1"
+        store.clear_dirty(["test-1", "test-2"])
+        assert list(store.iter_dirty_issues()) == []
+
+
+class TestTransactions:
+    def test_commit(self, store: SQLiteStorage):
+        with store.transaction():
+            store.create_issue(_make_issue("test-1"), "alice")
+            store.create_issue(_make_issue("test-2"), "alice")
+        assert store.get_issue("test-2") is not None
+
+    def test_rollback_on_error(self, store: SQLiteStorage):
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.create_issue(_make_issue("test-1"), "alice")
+                raise RuntimeError("boom")
+        assert store.get_issue("test-1") is None
+        assert store.get_dirty_issues() == []
+
+    def test_savepoint_rolls_back_only_inner_block(self, store: SQLiteStorage):
+        with store.transaction():
+            store.create_issue(_make_issue("test-1"), "alice")
+            with pytest.raises(RuntimeError):
+                with store.savepoint("inner"):
+                    store.create_issue(_make_issue("test-2"), "alice")
+                    raise RuntimeError("boom")
+        assert store.get_issue("test-1") is not None
+        assert store.get_issue("test-2") is None
+
+    def test_reads_inside_transaction_see_pending_writes(self, file_store: SQLiteStorage):
+        with file_store.transaction():
+            file_store.create_issue(_make_issue("test-1"), "alice")
+            assert file_store.get_issue("test-1") is not None
+            assert file_store.resolve_id("test-1") == "test-1"
+
+    def test_rollback_restores_cached_config(self, store: SQLiteStorage):
+        assert store.get_config("issue_prefix") == "test"
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store.set_config("issue_prefix", "other")
+                assert store.get_config("issue_prefix") == "other"
+                raise RuntimeError("boom")
+        assert store.get_config("issue_prefix") == "test"
+
 
 class TestStatistics:
     def test_basic_stats(self, store: SQLiteStorage):
-        store.create_issue(_make_issue("test-1", issue_type="task"), "alice")
-        store.create_issue(_make_issue("test-2", issue_type="bug"), "alice")
-        store.close_issue("test-2", "fixed", "alice")
+        with store.transaction():
+            store.create_issues_bulk([
+                _make_issue("test-1", issue_type="task"),
+                _make_issue("test-2", issue_type="bug"),
+            ], "alice")
+            store.close_issue("test-2", "fixed", "alice")
         stats = store.get_statistics()
         assert stats.total_issues == 2
         assert stats.open_issues == 1
         assert stats.closed_issues == 1
+        assert stats.ready_issues == 1
+
+
+class TestSchema:
+    def test_unversioned_db_is_migrated_and_stamped(self, file_store: SQLiteStorage):
+        file_store.create_issue(_make_issue("test-1"), "alice")
+        path = file_store.path()
+        file_store._conn.execute("DROP TABLE child_counters")
+        file_store._conn.execute("PRAGMA user_version = 0")
+        file_store._conn.commit()
+        reopened = SQLiteStorage(path)
+        try:
+            conn = reopened._conn
+            assert conn.execute("PRAGMA user_version").fetchone()[0] > 0
+            assert conn.execute(
+                "SELECT count(*) FROM sqlite_master WHERE name = 'child_counters'"
+            ).fetchone()[0] == 1
+            assert reopened.get_issue("test-1") is not None
+        finally:
+            reopened.close()